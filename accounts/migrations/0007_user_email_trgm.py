@@ -0,0 +1,34 @@
+# Trigram index backing the admin "user email contains" filter.
+#
+# Django compiles ``icontains`` on PostgreSQL to ``UPPER(col::text) LIKE
+# UPPER(%s)``, so the GIN index is built on that exact expression. pg_trgm is
+# PostgreSQL-only; on other backends this migration is a no-op.
+
+from django.db import migrations
+
+
+def create_email_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS user_email_trgm ON accounts_user '
+        'USING gin (UPPER(("email")::text) gin_trgm_ops)'
+    )
+
+
+def drop_email_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS user_email_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_user_email_message_notifications'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_email_trgm_index, drop_email_trgm_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-16 18:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_user_active_ads_cache_user_featured_ads_cache_and_more'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['is_suspended', 'is_active', '-created_at'], name='accounts_us_is_susp_5ba1fe_idx'),
+        ),
+    ]
@@ -100,6 +100,12 @@ class User(AbstractUser):
         help_text=_('Reason for suspension')
     )
     
+    # Denormalized ad counters, maintained by ads.signals
+    total_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    active_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    pending_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    featured_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    
     # Tracking fields
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -117,6 +123,7 @@ class User(AbstractUser):
             models.Index(fields=['email']),
             models.Index(fields=['google_id']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['is_suspended', 'is_active', '-created_at']),
             models.Index(fields=['email_verification_token']),
             models.Index(fields=['password_reset_token']),
         ]
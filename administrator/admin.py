@@ -3,6 +3,9 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
+from django.db.models import Count, Q
+from ads.models import Ad, AdReport
+from accounts.models import User
 from .models import Banner, AdminSettings, BannerClick, BannerImpression
 
 # ============================================================================
@@ -238,16 +241,25 @@ class CustomAdminSite(admin.AdminSite):
         """Custom admin index with dashboard stats."""
         extra_context = extra_context or {}
         
-        # Get quick stats
-        from ads.models import Ad, AdReport
-        from accounts.models import User
+        # Get quick stats - one aggregate query per table
+        ad_stats = Ad.objects.aggregate(
+            total=Count('id', filter=~Q(status='deleted')),
+            pending=Count('id', filter=Q(status='pending')),
+        )
+        user_stats = User.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True, is_suspended=False)),
+        )
+        report_stats = AdReport.objects.aggregate(
+            pending=Count('id', filter=Q(is_reviewed=False)),
+        )
         
         extra_context.update({
-            'total_ads': Ad.objects.exclude(status='deleted').count(),
-            'pending_ads': Ad.objects.filter(status='pending').count(),
-            'total_users': User.objects.count(),
-            'active_users': User.objects.filter(is_active=True, is_suspended=False).count(),
-            'pending_reports': AdReport.objects.filter(is_reviewed=False).count(),
+            'total_ads': ad_stats['total'],
+            'pending_ads': ad_stats['pending'],
+            'total_users': user_stats['total'],
+            'active_users': user_stats['active'],
+            'pending_reports': report_stats['pending'],
         })
         
         return super().index(request, extra_context)
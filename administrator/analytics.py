@@ -0,0 +1,336 @@
+# administrator/analytics.py
+"""
+Precomputed figures behind the admin analytics views.
+
+Counting raw ads, views and contacts per day rescans the fact tables on
+every request. DailyActivity keeps those per-day counts for closed days,
+BannerDailyStats the same for banner impressions and clicks, and
+CategorySummary the per-category totals; ``manage.py refresh_analytics``
+rebuilds them and is meant to run periodically (e.g. nightly from cron).
+Readers take closed days from the rollup and count only the still-open
+edges of the range live, falling back to live counts for the whole range
+while the rollup does not cover it.
+"""
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import CharField, Count, Q, Sum, Value
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from ads.models import Ad, AdContact, AdView
+from content.models import Category
+from .models import (
+    Banner,
+    BannerClick,
+    BannerDailyStats,
+    BannerImpression,
+    CategorySummary,
+    DailyActivity,
+)
+
+
+def daily_counts(**series):
+    """
+    Per-day row counts for several querysets in one UNION ALL query.
+
+    Each keyword maps a series name to ``(queryset, date_field)``. Returns
+    ``{name: [{"date": ..., "count": ...}, ...]}`` with days in ascending
+    order; series without rows map to an empty list.
+    """
+    grouped = [
+        queryset.order_by()
+        .annotate(
+            series=Value(name, output_field=CharField()),
+            date=TruncDate(date_field),
+        )
+        .values("series", "date")
+        .annotate(count=Count("id"))
+        for name, (queryset, date_field) in series.items()
+    ]
+
+    result = {name: [] for name in series}
+    for row in grouped[0].union(*grouped[1:], all=True).order_by("date"):
+        result[row["series"]].append({"date": row["date"], "count": row["count"]})
+    return result
+
+
+def activity_sources(state_filter="all"):
+    """
+    Querysets behind each DailyActivity kind, as ``(queryset, date_field,
+    state_field)``, restricted to ads of ``state_filter``.
+    """
+    ads_qs = Ad.non_deleted.all()
+    # Views and contacts join their ad rather than test ad_id IN (subquery)
+    views_qs = AdView.objects.exclude(ad__status="deleted")
+    contacts_qs = AdContact.objects.exclude(ad__status="deleted")
+    if state_filter != "all":
+        ads_qs = ads_qs.filter(state__code=state_filter)
+        views_qs = views_qs.filter(ad__state__code=state_filter)
+        contacts_qs = contacts_qs.filter(ad__state__code=state_filter)
+    return {
+        "ads": (ads_qs, "created_at", "state"),
+        "views": (views_qs, "viewed_at", "ad__state"),
+        "contacts": (contacts_qs, "viewed_at", "ad__state"),
+    }
+
+
+def start_of_day(day):
+    """Aware datetime at midnight of ``day`` in the current time zone."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def refresh_daily_activity(days):
+    """
+    Rebuild the DailyActivity rows of the ``days`` closed days before today.
+
+    Returns the number of rows written.
+    """
+    today = timezone.localdate()
+    first_day = today - timedelta(days=days)
+
+    rows = []
+    for kind, (queryset, date_field, state_field) in activity_sources().items():
+        window = {
+            f"{date_field}__gte": start_of_day(first_day),
+            f"{date_field}__lt": start_of_day(today),
+        }
+        totals = dict.fromkeys(
+            (first_day + timedelta(days=offset) for offset in range(days)), 0
+        )
+        per_state = (
+            queryset.filter(**window)
+            .order_by()
+            .annotate(day=TruncDate(date_field))
+            .values("day", state_field)
+            .annotate(count=Count("id"))
+        )
+        for row in per_state:
+            totals[row["day"]] += row["count"]
+            rows.append(
+                DailyActivity(
+                    day=row["day"],
+                    kind=kind,
+                    state_id=row[state_field],
+                    count=row["count"],
+                )
+            )
+        rows.extend(
+            DailyActivity(day=day, kind=kind, state=None, count=count)
+            for day, count in totals.items()
+        )
+
+    with transaction.atomic():
+        DailyActivity.objects.filter(day__gte=first_day, day__lt=today).delete()
+        DailyActivity.objects.bulk_create(rows)
+    return len(rows)
+
+
+def activity_series(start_date, state_filter="all"):
+    """
+    Daily ``ads``, ``views`` and ``contacts`` series from ``start_date`` on.
+
+    Same result as counting the raw rows with daily_counts(). Whole days
+    strictly between the (partial) first day and today come from
+    DailyActivity when it has them all; the rest is counted live.
+    """
+    sources = activity_sources(state_filter)
+    first_day = timezone.localtime(start_date).date()
+    today = timezone.localdate()
+    closed_days = (today - first_day).days - 1
+
+    rolled_up = None
+    if closed_days > 0:
+        rolled_up = rolled_up_series(
+            first_day + timedelta(days=1), today, closed_days, state_filter
+        )
+
+    if rolled_up is None:
+        # No usable rollup: count the whole range live
+        return daily_counts(
+            **{
+                kind: (queryset.filter(**{f"{date_field}__gte": start_date}), date_field)
+                for kind, (queryset, date_field, _) in sources.items()
+            }
+        )
+
+    # Only the partial first day and today are still counted live
+    open_edges = {
+        kind: (
+            queryset.filter(open_edges_filter(date_field, start_date, today)),
+            date_field,
+        )
+        for kind, (queryset, date_field, _) in sources.items()
+    }
+    live = daily_counts(**open_edges)
+    return {
+        kind: sorted(live[kind] + rolled_up[kind], key=lambda row: row["date"])
+        for kind in sources
+    }
+
+
+def open_edges_filter(date_field, start_date, today):
+    """
+    Q for rows of ``date_field`` on the partial day of ``start_date`` or on
+    ``today``, the days a rollup does not cover.
+    """
+    day_after_start = timezone.localtime(start_date).date() + timedelta(days=1)
+    return Q(**{f"{date_field}__gte": start_date}) & (
+        Q(**{f"{date_field}__lt": start_of_day(day_after_start)})
+        | Q(**{f"{date_field}__gte": start_of_day(today)})
+    )
+
+
+def rolled_up_series(first_day, end_day, expected_days, state_filter):
+    """
+    Rollup rows for ``first_day`` up to (not including) ``end_day``, or None
+    unless every day of every kind has been materialized.
+    """
+    rows = DailyActivity.objects.filter(day__gte=first_day, day__lt=end_day)
+    if state_filter == "all":
+        rows = rows.filter(state__isnull=True)
+    else:
+        rows = rows.filter(Q(state__isnull=True) | Q(state__code=state_filter))
+
+    series = {kind: [] for kind, _ in DailyActivity.KIND_CHOICES}
+    materialized = 0
+    for row in rows.order_by("day").values("day", "kind", "state_id", "count"):
+        if row["state_id"] is None:
+            materialized += 1
+            if state_filter != "all":
+                continue
+        if row["count"]:
+            series[row["kind"]].append({"date": row["day"], "count": row["count"]})
+
+    if materialized < expected_days * len(series):
+        return None
+    return series
+
+
+def refresh_category_summaries():
+    """
+    Rebuild CategorySummary from the ads table in one grouped query.
+
+    Returns the number of rows written.
+    """
+    totals = Category.objects.annotate(
+        summed_views=Coalesce(Sum("ads__view_count"), 0),
+        summed_prices=Sum("ads__price"),
+        priced=Count("ads__price"),
+    ).values_list("pk", "summed_views", "summed_prices", "priced")
+
+    rows = [
+        CategorySummary(
+            category_id=category_id,
+            total_views=views,
+            price_total=prices or 0,
+            priced_ads=priced,
+        )
+        for category_id, views, prices, priced in totals
+    ]
+
+    with transaction.atomic():
+        CategorySummary.objects.all().delete()
+        CategorySummary.objects.bulk_create(rows)
+    return len(rows)
+
+
+def refresh_banner_daily_stats(days):
+    """
+    Rebuild the BannerDailyStats rows of the ``days`` closed days before
+    today for every banner.
+
+    Returns the number of rows written.
+    """
+    today = timezone.localdate()
+    first_day = today - timedelta(days=days)
+
+    rows = {
+        (banner_id, first_day + timedelta(days=offset)): BannerDailyStats(
+            banner_id=banner_id, day=first_day + timedelta(days=offset)
+        )
+        for banner_id in Banner.objects.values_list("pk", flat=True)
+        for offset in range(days)
+    }
+    for model, date_field, counter in (
+        (BannerImpression, "viewed_at", "impressions"),
+        (BannerClick, "clicked_at", "clicks"),
+    ):
+        per_day = (
+            model.objects.filter(
+                **{
+                    f"{date_field}__gte": start_of_day(first_day),
+                    f"{date_field}__lt": start_of_day(today),
+                }
+            )
+            .annotate(day=TruncDate(date_field))
+            .values_list("banner_id", "day")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        for banner_id, day, count in per_day:
+            if (banner_id, day) in rows:
+                setattr(rows[banner_id, day], counter, count)
+
+    with transaction.atomic():
+        BannerDailyStats.objects.filter(day__gte=first_day, day__lt=today).delete()
+        BannerDailyStats.objects.bulk_create(rows.values())
+    return len(rows)
+
+
+def banner_series(banner, start_date):
+    """
+    Daily ``impressions`` and ``clicks`` of ``banner`` from ``start_date`` on.
+
+    Same result as counting the raw rows with daily_counts(). Whole days
+    strictly between the (partial) first day and today come from
+    BannerDailyStats when it has them all; the rest is counted live.
+    """
+    sources = {
+        "impressions": (BannerImpression.objects.filter(banner=banner), "viewed_at"),
+        "clicks": (BannerClick.objects.filter(banner=banner), "clicked_at"),
+    }
+    first_day = timezone.localtime(start_date).date()
+    today = timezone.localdate()
+    closed_days = (today - first_day).days - 1
+
+    stats = None
+    if closed_days > 0:
+        stats = list(
+            BannerDailyStats.objects.filter(
+                banner=banner,
+                day__gt=first_day,
+                day__lt=today,
+            ).values_list("day", "impressions", "clicks")
+        )
+        if len(stats) < closed_days:
+            stats = None
+
+    if stats is None:
+        # No usable rollup: count the whole range live
+        return daily_counts(
+            **{
+                name: (queryset.filter(**{f"{date_field}__gte": start_date}), date_field)
+                for name, (queryset, date_field) in sources.items()
+            }
+        )
+
+    # Only the partial first day and today are still counted live
+    series = daily_counts(
+        **{
+            name: (
+                queryset.filter(open_edges_filter(date_field, start_date, today)),
+                date_field,
+            )
+            for name, (queryset, date_field) in sources.items()
+        }
+    )
+    for day, impressions, clicks in stats:
+        if impressions:
+            series["impressions"].append({"date": day, "count": impressions})
+        if clicks:
+            series["clicks"].append({"date": day, "count": clicks})
+    return {
+        name: sorted(rows, key=lambda row: row["date"])
+        for name, rows in series.items()
+    }
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AdministratorConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'administrator'
+
+    def ready(self):
+        """Import signal handlers when app is ready."""
+        import administrator.signals
@@ -3,17 +3,46 @@ from rest_framework import status, generics
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
 from django.contrib.auth import authenticate
+from django.core.cache import cache
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+import hashlib
 import logging
 
 from accounts.models import User
 from accounts.serializers import UserSerializer
 from core.utils import get_client_ip
+from .cache_utils import ADMIN_USER_STATE_TIMEOUT, admin_user_state_key
 
 logger = logging.getLogger(__name__)
 
+# Login attempts allowed per (IP, email) pair within the throttle window
+ADMIN_LOGIN_MAX_ATTEMPTS = 5
+ADMIN_LOGIN_WINDOW_SECONDS = 60
+
+
+def register_login_attempt(cache_key):
+    """Count a login attempt and return the number made in the current window."""
+    if cache.add(cache_key, 1, ADMIN_LOGIN_WINDOW_SECONDS):
+        return 1
+    try:
+        return cache.incr(cache_key)
+    except ValueError:
+        # Key expired between add() and incr()
+        cache.set(cache_key, 1, ADMIN_LOGIN_WINDOW_SECONDS)
+        return 1
+
+
+def admin_profile_etag(user):
+    """Build an ETag for the admin profile payload of the given user."""
+    last_login = user.last_login.timestamp() if user.last_login else ''
+    fingerprint = f"{user.id}:{user.updated_at.timestamp()}:{last_login}"
+    return quote_etag(hashlib.md5(fingerprint.encode()).hexdigest())
+
 
 class AdminLoginView(generics.GenericAPIView):
     """
@@ -32,6 +61,16 @@ class AdminLoginView(generics.GenericAPIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        # Throttle before authenticate() so the password hasher never runs
+        # for requests over the limit
+        attempts_key = f"admin_login_attempts:{get_client_ip(request)}:{email}"
+        if register_login_attempt(attempts_key) > ADMIN_LOGIN_MAX_ATTEMPTS:
+            logger.warning(f"Throttled admin login attempts for {email}")
+            return Response(
+                {'error': 'Too many login attempts. Please try again later.'},
+                status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+        
         # Authenticate user
         user = authenticate(request, email=email, password=password)
         
@@ -80,6 +119,8 @@ class AdminLoginView(generics.GenericAPIView):
         user.last_login_ip = get_client_ip(request)
         user.save(update_fields=['last_login', 'last_login_ip'])
         
+        cache.delete(attempts_key)
+        
         logger.info(f"Admin login successful: {user.email} (staff={user.is_staff}, super={user.is_superuser})")
         
         return Response({
@@ -140,7 +181,13 @@ class AdminProfileView(generics.GenericAPIView):
         
         user = request.user
         
-        return Response({
+        # The frontend polls this endpoint; answer unchanged profiles with 304
+        etag = admin_profile_etag(user)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+        
+        response = Response({
             'id': user.id,
             'email': user.email,
             'first_name': user.first_name,
@@ -154,6 +201,8 @@ class AdminProfileView(generics.GenericAPIView):
             'created_at': user.created_at,
             'last_login': user.last_login,
         })
+        response['ETag'] = etag
+        return response
 
 
 @api_view(['POST'])
@@ -163,9 +212,6 @@ def admin_verify_token(request):
     Verify if a token is valid and belongs to an admin user.
     Used by frontend to check if user is still authenticated.
     """
-    from rest_framework_simplejwt.tokens import AccessToken
-    from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
-    
     token = request.data.get('token')
     
     if not token:
@@ -179,18 +225,27 @@ def admin_verify_token(request):
         access_token = AccessToken(token)
         user_id = access_token['user_id']
         
-        # Get user
-        user = User.objects.get(id=user_id)
+        # Get user state, cached so polling clients skip the DB
+        state_key = admin_user_state_key(user_id)
+        user = cache.get(state_key)
+        if user is None:
+            user = User.objects.filter(id=user_id).values(
+                'id', 'email', 'first_name', 'last_name',
+                'is_staff', 'is_superuser', 'is_active',
+            ).first()
+            if user is None:
+                raise User.DoesNotExist
+            cache.set(state_key, user, ADMIN_USER_STATE_TIMEOUT)
         
         # Check if user is admin
-        if not (user.is_staff or user.is_superuser):
+        if not (user['is_staff'] or user['is_superuser']):
             return Response(
                 {'valid': False, 'error': 'Not an admin user.'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
         # Check if user is active
-        if not user.is_active:
+        if not user['is_active']:
             return Response(
                 {'valid': False, 'error': 'User is inactive.'},
                 status=status.HTTP_403_FORBIDDEN
@@ -199,11 +254,11 @@ def admin_verify_token(request):
         return Response({
             'valid': True,
             'user': {
-                'id': user.id,
-                'email': user.email,
-                'full_name': user.get_full_name(),
-                'is_staff': user.is_staff,
-                'is_superuser': user.is_superuser,
+                'id': user['id'],
+                'email': user['email'],
+                'full_name': f"{user['first_name']} {user['last_name']}".strip(),
+                'is_staff': user['is_staff'],
+                'is_superuser': user['is_superuser'],
             }
         })
         
@@ -0,0 +1,144 @@
+# administrator/cache_utils.py
+"""Cache keys shared by admin views and the signals that invalidate them."""
+from django.core.cache import cache
+
+from .models import AdminSettings
+
+# Seconds a cached admin user state stays valid
+ADMIN_USER_STATE_TIMEOUT = 60
+
+
+def admin_user_state_key(user_id):
+    """Cache key for the user fields checked by admin token verification."""
+    return f"admin_user_state:{user_id}"
+
+
+def invalidate_admin_user_states(user_ids):
+    """Drop the cached admin state of several users at once."""
+    cache.delete_many([admin_user_state_key(user_id) for user_id in user_ids])
+
+
+# Serialized AdminSettings singleton. Saving the row drops it, but only
+# from the cache of the process that saved it when the backend is per
+# process (LocMemCache), so the timeout bounds how long others lag
+ADMIN_SETTINGS_CACHE_KEY = "admin_settings_v1"
+ADMIN_SETTINGS_TIMEOUT = 60
+
+# Values the settings row is created with on first use
+ADMIN_SETTINGS_DEFAULTS = {
+    "site_name": "Classified Ads",
+    "contact_email": "",
+    "support_phone": "",
+    "allow_registration": True,
+    "require_email_verification": True,
+    "auto_approve_ads": False,
+    "featured_ad_price": 9.99,
+    "featured_ad_duration_days": 30,
+}
+
+
+def get_admin_settings():
+    """
+    The AdminSettings values as the admin settings endpoint serves them,
+    from the cache when warm. The row is created with defaults if missing.
+    """
+    data = cache.get(ADMIN_SETTINGS_CACHE_KEY)
+    if data is not None:
+        return data
+
+    settings, _ = AdminSettings.objects.get_or_create(
+        pk=1, defaults=ADMIN_SETTINGS_DEFAULTS
+    )
+    data = {
+        "site_name": settings.site_name,
+        "contact_email": settings.contact_email,
+        "support_phone": settings.support_phone,
+        "allow_registration": settings.allow_registration,
+        "require_email_verification": settings.require_email_verification,
+        "auto_approve_ads": settings.auto_approve_ads,
+        "featured_ad_price": float(settings.featured_ad_price),
+        "featured_ad_duration_days": settings.featured_ad_duration_days,
+    }
+    # Dropped when the settings row changes; see administrator.signals
+    cache.set(ADMIN_SETTINGS_CACHE_KEY, data, ADMIN_SETTINGS_TIMEOUT)
+    return data
+
+
+def get_featured_ad_price():
+    """Configured price of a featured ad."""
+    return get_admin_settings()["featured_ad_price"]
+
+
+# Seconds a cached admin ad list row stays valid; bounds staleness from
+# writes that bypass model signals
+ADMIN_AD_ROW_TIMEOUT = 300
+ADMIN_AD_ROWS_GENERATION_KEY = "admin_ad_rows_generation"
+# Bump when the shape of the cached rows changes
+ADMIN_AD_ROW_VERSION = 2
+
+
+def get_generation(key):
+    """Current value of a generation counter embedded in related cache keys."""
+    return cache.get_or_set(key, 1, None)
+
+
+def bump_generation(key):
+    """Retire every cache key built from the generation counter ``key``."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def admin_ad_rows_generation():
+    """Current generation of the admin ad row cache."""
+    return get_generation(ADMIN_AD_ROWS_GENERATION_KEY)
+
+
+def bump_admin_ad_rows_generation():
+    """Invalidate every cached admin ad row at once."""
+    bump_generation(ADMIN_AD_ROWS_GENERATION_KEY)
+
+
+def admin_ad_row_key(ad_id, generation=None):
+    """Cache key for the values() row behind one admin ad list entry."""
+    if generation is None:
+        generation = admin_ad_rows_generation()
+    return f"admin_ad_row:{ADMIN_AD_ROW_VERSION}:{generation}:{ad_id}"
+
+
+def invalidate_admin_ad_rows(ad_ids):
+    """Drop the cached admin list rows of the given ads."""
+    generation = admin_ad_rows_generation()
+    cache.delete_many([admin_ad_row_key(ad_id, generation) for ad_id in ad_ids])
+
+
+# Admin figures derived from ads, users and reports (dashboard, state list,
+# category stats) share one generation so a single bump retires them all.
+# With a per-process cache backend the bump only reaches the process that
+# made it, so every figure also carries a short timeout that bounds how
+# long other processes serve it stale
+ADMIN_STATS_GENERATION_KEY = "admin_stats_generation"
+
+# Seconds the dashboard may lag; it also holds time-based figures that no
+# signal invalidates
+ADMIN_DASHBOARD_TIMEOUT = 60
+
+# Seconds an analytics response may be cached; views and contacts are
+# recorded too often to invalidate on, so this bounds how far they lag
+ADMIN_ANALYTICS_TIMEOUT = 5 * 60
+
+# Seconds the state list and category stats may be cached; ad, state and
+# category changes invalidate them sooner in the process that made them
+ADMIN_CATALOG_TIMEOUT = 60
+
+
+def admin_stats_key(view, *params):
+    """Cache key for the admin figures of ``view`` computed for ``params``."""
+    generation = get_generation(ADMIN_STATS_GENERATION_KEY)
+    return ":".join(["admin", view, str(generation), *map(str, params)])
+
+
+def invalidate_admin_stats():
+    """Drop every cached admin figure at once."""
+    bump_generation(ADMIN_STATS_GENERATION_KEY)
@@ -1,9 +1,9 @@
 # administrator/filters.py
 import django_filters
-from ads.models import Ad, AdReport
+from ads.models import Ad, AdImage, AdReport
 from accounts.models import User
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from ads.filters import BaseAdFilter
 
 
@@ -44,6 +44,7 @@ class AdminAdFilter(BaseAdFilter):
     )
     
     # ========== Admin-Only: User Filters ==========
+    # icontains lookups below are backed by pg_trgm GIN indexes on PostgreSQL
     user = django_filters.NumberFilter(
         field_name='user__id',
         help_text='Filter by user ID'
@@ -107,13 +108,15 @@ class AdminAdFilter(BaseAdFilter):
     
     # ========== Admin-Only: Filter Methods ==========
     
+    # Reverse relations are tested with EXISTS so they never join extra rows
+    # into the ad list (which would then need DISTINCT over every column)
+
     def filter_has_images(self, queryset, name, value):
         """Filter ads that have/don't have images."""
-        if value is True:
-            return queryset.filter(images__isnull=False).distinct()
-        elif value is False:
-            return queryset.filter(images__isnull=True)
-        return queryset
+        if value is None:
+            return queryset
+        has_images = Exists(AdImage.objects.filter(ad=OuterRef('pk')))
+        return queryset.filter(has_images if value else ~has_images)
     
     def filter_has_phone(self, queryset, name, value):
         """Filter ads that have/don't have phone numbers."""
@@ -129,25 +132,17 @@ class AdminAdFilter(BaseAdFilter):
     
     def filter_is_featured(self, queryset, name, value):
         """Filter currently active featured ads."""
-        if value is True:
-            return queryset.filter(
-                plan='featured',
-                featured_expires_at__gt=timezone.now()
-            )
-        elif value is False:
-            return queryset.exclude(
-                plan='featured',
-                featured_expires_at__gt=timezone.now()
-            )
-        return queryset
+        if value is None:
+            return queryset
+        featured = Q(plan='featured', featured_expires_at__gt=timezone.now())
+        return queryset.filter(featured if value else ~featured)
     
     def filter_has_reports(self, queryset, name, value):
         """Filter ads that have/don't have reports."""
-        if value is True:
-            return queryset.filter(reports__isnull=False).distinct()
-        elif value is False:
-            return queryset.filter(reports__isnull=True)
-        return queryset
+        if value is None:
+            return queryset
+        has_reports = Exists(AdReport.objects.filter(ad=OuterRef('pk')))
+        return queryset.filter(has_reports if value else ~has_reports)
 
 
 class AdminUserFilter(django_filters.FilterSet):
@@ -189,9 +184,8 @@ class AdminUserFilter(django_filters.FilterSet):
     
     def filter_has_ads(self, queryset, name, value):
         """Filter users who have ads."""
-        if value:
-            return queryset.filter(ads__isnull=False).distinct()
-        return queryset.filter(ads__isnull=True)
+        has_ads = Exists(Ad.objects.filter(user=OuterRef('pk')))
+        return queryset.filter(has_ads if value else ~has_ads)
 
 
 class AdminReportFilter(django_filters.FilterSet):
@@ -0,0 +1,32 @@
+# administrator/management/commands/refresh_analytics.py
+from django.core.management.base import BaseCommand
+
+from administrator.analytics import (
+    refresh_banner_daily_stats,
+    refresh_category_summaries,
+    refresh_daily_activity,
+)
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the daily activity, banner and category summary rollups behind the admin analytics'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=366,
+            help='Number of closed days before today to rebuild (default: 366)',
+        )
+
+    def handle(self, *args, **options):
+        written = refresh_daily_activity(options['days'])
+        self.stdout.write(f'Wrote {written} daily activity rows')
+
+        written = refresh_banner_daily_stats(options['days'])
+        self.stdout.write(f'Wrote {written} banner daily stats rows')
+
+        written = refresh_category_summaries()
+        self.stdout.write(f'Wrote {written} category summary rows')
+
+        self.stdout.write(self.style.SUCCESS('Analytics rollups are up to date'))
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administrator', '0003_adminsettings_allow_registration_and_more'),
+        ('content', '0004_state_live_featured_ads_cache_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Day')),
+                ('kind', models.CharField(choices=[('ads', 'New Ads'), ('views', 'Ad Views'), ('contacts', 'Ad Contacts')], max_length=20, verbose_name='Kind')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='Count')),
+                ('state', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='daily_activity', to='content.state')),
+            ],
+            options={
+                'verbose_name': 'Daily Activity',
+                'verbose_name_plural': 'Daily Activity',
+                'indexes': [models.Index(fields=['state', 'day'], name='administrat_state_i_1fa564_idx')],
+                'constraints': [models.UniqueConstraint(fields=('day', 'kind', 'state'), name='daily_activity_unique_day_kind_state')],
+            },
+        ),
+    ]
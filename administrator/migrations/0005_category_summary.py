@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-16 18:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administrator', '0004_daily_activity'),
+        ('content', '0004_state_live_featured_ads_cache_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategorySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_views', models.PositiveBigIntegerField(default=0, verbose_name='Total Views')),
+                ('price_total', models.DecimalField(decimal_places=2, default=0, max_digits=16, verbose_name='Price Total')),
+                ('priced_ads', models.PositiveIntegerField(default=0, verbose_name='Priced Ads')),
+                ('refreshed_at', models.DateTimeField(auto_now=True, verbose_name='Refreshed At')),
+                ('category', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='summary', to='content.category')),
+            ],
+            options={
+                'verbose_name': 'Category Summary',
+                'verbose_name_plural': 'Category Summaries',
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-16 18:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administrator', '0005_category_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BannerDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Day')),
+                ('impressions', models.PositiveIntegerField(default=0, verbose_name='Impressions')),
+                ('clicks', models.PositiveIntegerField(default=0, verbose_name='Clicks')),
+                ('banner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='administrator.banner')),
+            ],
+            options={
+                'verbose_name': 'Banner Daily Stats',
+                'verbose_name_plural': 'Banner Daily Stats',
+                'constraints': [models.UniqueConstraint(fields=('banner', 'day'), name='banner_daily_stats_unique_banner_day')],
+            },
+        ),
+    ]
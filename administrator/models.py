@@ -207,6 +207,119 @@ class BannerClick(models.Model):
             models.Index(fields=['clicked_at']),
         ]
 
+class DailyActivity(models.Model):
+    """
+    Per-day ad, view and contact counts behind the analytics overview.
+
+    Rows with a state hold that state's count; the row with no state holds
+    the day's total and is written even when it is zero, so it also marks
+    the day as materialized. Maintained by administrator.analytics.
+    """
+
+    KIND_CHOICES = [
+        ('ads', _('New Ads')),
+        ('views', _('Ad Views')),
+        ('contacts', _('Ad Contacts')),
+    ]
+
+    day = models.DateField(_('Day'))
+    kind = models.CharField(_('Kind'), max_length=20, choices=KIND_CHOICES)
+    state = models.ForeignKey(
+        State,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='daily_activity'
+    )
+    count = models.PositiveIntegerField(_('Count'), default=0)
+
+    class Meta:
+        verbose_name = _('Daily Activity')
+        verbose_name_plural = _('Daily Activity')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'kind', 'state'],
+                name='daily_activity_unique_day_kind_state',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['state', 'day']),
+        ]
+
+    def __str__(self):
+        return f'{self.day} {self.kind}: {self.count}'
+
+
+class CategorySummary(models.Model):
+    """
+    Per-category ad totals behind the category analytics.
+
+    Summing view counts and prices needs a scan of the ads table, so these
+    are rebuilt periodically by administrator.analytics. Between rebuilds
+    administrator.signals adds each newly recorded view to total_views; the
+    next rebuild corrects any drift. ``price_total / priced_ads`` is the
+    average price.
+    """
+
+    category = models.OneToOneField(
+        Category,
+        on_delete=models.CASCADE,
+        related_name='summary'
+    )
+    total_views = models.PositiveBigIntegerField(_('Total Views'), default=0)
+    price_total = models.DecimalField(
+        _('Price Total'), max_digits=16, decimal_places=2, default=0
+    )
+    priced_ads = models.PositiveIntegerField(_('Priced Ads'), default=0)
+    refreshed_at = models.DateTimeField(_('Refreshed At'), auto_now=True)
+
+    class Meta:
+        verbose_name = _('Category Summary')
+        verbose_name_plural = _('Category Summaries')
+
+    def __str__(self):
+        return f'{self.category} summary'
+
+    @property
+    def avg_price(self):
+        """Average price of the category's priced ads, or None without any."""
+        if not self.priced_ads:
+            return None
+        return self.price_total / self.priced_ads
+
+
+class BannerDailyStats(models.Model):
+    """
+    Per-day impression and click counts of a banner behind its analytics.
+
+    Every banner gets a row for every rebuilt day, zero counts included, so
+    a row also marks the day as materialized. Maintained by
+    administrator.analytics.
+    """
+
+    banner = models.ForeignKey(
+        Banner,
+        on_delete=models.CASCADE,
+        related_name='daily_stats'
+    )
+    day = models.DateField(_('Day'))
+    impressions = models.PositiveIntegerField(_('Impressions'), default=0)
+    clicks = models.PositiveIntegerField(_('Clicks'), default=0)
+
+    class Meta:
+        verbose_name = _('Banner Daily Stats')
+        verbose_name_plural = _('Banner Daily Stats')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['banner', 'day'],
+                name='banner_daily_stats_unique_banner_day',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.banner} {self.day}: {self.impressions}/{self.clicks}'
+
+
 class AdminSettings(models.Model):
     """Model for storing basic admin panel settings."""
     
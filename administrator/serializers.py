@@ -1,13 +1,54 @@
+from collections.abc import Mapping
+
 from rest_framework import serializers
+from rest_framework.utils import html
 from django.contrib.auth import get_user_model
-from ads.models import Ad, AdReport
+from django.core.cache import cache
+from django.db.models import CharField, Prefetch, Q, Value
+from django.db.models.functions import Concat, Trim
+from django.utils import timezone
+from ads.models import Ad, AdImage, AdReport
 from content.models import Category, State, City
 from .models import Banner, AdminSettings
 from ads.serializers import AdImageSerializer
+from .cache_utils import ADMIN_AD_ROW_TIMEOUT, admin_ad_row_key, admin_ad_rows_generation
 
 User = get_user_model()
 
 
+def full_name_expression(prefix=""):
+    """SQL equivalent of User.get_full_name() for the user at ``prefix``."""
+    return Trim(
+        Concat(
+            f"{prefix}first_name",
+            Value(" "),
+            f"{prefix}last_name",
+            output_field=CharField(),
+        )
+    )
+
+
+class TimestampedSerializerMixin:
+    """Share a single "now" across every row of one serialization run."""
+
+    def get_now(self):
+        context = self.context
+        if "_now" not in context:
+            context["_now"] = timezone.now()
+        return context["_now"]
+
+
+class RepresentationCacheMixin:
+    """Reuse nested representations of objects repeated within one run."""
+
+    def get_cached_representation(self, kind, instance, build):
+        cache = self.context.setdefault("_representations", {})
+        key = (kind, instance.pk)
+        if key not in cache:
+            cache[key] = build(instance)
+        return dict(cache[key])
+
+
 class AdminLoginSerializer(serializers.Serializer):
     """Serializer for admin login."""
     
@@ -40,7 +81,7 @@ class AdminPasswordChangeSerializer(serializers.Serializer):
 # ============================================================================
 
 
-class AdminAdSerializer(serializers.ModelSerializer):
+class AdminAdSerializer(TimestampedSerializerMixin, serializers.ModelSerializer):
     """Serializer for admin ad management."""
 
     user_name = serializers.CharField(source="user.get_full_name", read_only=True)
@@ -81,11 +122,169 @@ class AdminAdSerializer(serializers.ModelSerializer):
             "primary_image",
         ]
 
+    # Columns read above, plus the ones Ad.save() and the ad counter signals
+    # read when an admin action saves the same instance
+    model_fields = [
+        "id",
+        "title",
+        "slug",
+        "description",
+        "price",
+        "status",
+        "plan",
+        "view_count",
+        "contact_count",
+        "favorite_count",
+        "created_at",
+        "updated_at",
+        "expires_at",
+        "featured_expires_at",
+        "rejection_reason",
+        "admin_notes",
+        "user__first_name",
+        "user__last_name",
+        "user__email",
+        "category__name",
+        "city__name",
+        "state__name",
+        "state__code",
+    ]
+
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """Load every relation this serializer reads in a fixed number of queries."""
+        return (
+            queryset.select_related("user", "category", "city", "state")
+            .only(*cls.model_fields)
+            .prefetch_related("images")
+        )
+
     def get_days_ago(self, obj):
         """Get days since ad was created."""
-        from django.utils import timezone
+        delta = self.get_now() - obj.created_at
+        return delta.days
 
-        delta = timezone.now() - obj.created_at
+
+class AdminAdRowListSerializer(serializers.ListSerializer):
+    """Attach images to a page of ad rows with a single query."""
+
+    def to_representation(self, data):
+        rows = list(data.all() if hasattr(data, "all") else data)
+        attach_ad_images(rows)
+        return [self.child.to_representation(row) for row in rows]
+
+
+def attach_ad_images(rows):
+    """Set "images" and "primary_image" on ad value rows in one query."""
+    rows = [row for row in rows if "images" not in row]
+    if not rows:
+        return
+
+    images_by_ad = {}
+    for image in AdImage.objects.filter(ad_id__in=[row["id"] for row in rows]):
+        images_by_ad.setdefault(image.ad_id, []).append(image)
+
+    for row in rows:
+        images = images_by_ad.get(row["id"], [])
+        row["images"] = images
+        row["primary_image"] = next(
+            (image for image in images if image.is_primary), None
+        )
+
+
+class AdminAdListSerializer(TimestampedSerializerMixin, serializers.Serializer):
+    """Serializer for the admin ad list, fed by values() rows.
+
+    Produces the same output as AdminAdSerializer without building Ad,
+    User, Category, City and State instances for every row.
+    """
+
+    id = serializers.IntegerField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    price = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+    status = serializers.CharField(read_only=True)
+    plan = serializers.CharField(read_only=True)
+    view_count = serializers.IntegerField(read_only=True)
+    contact_count = serializers.IntegerField(read_only=True)
+    favorite_count = serializers.IntegerField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+    expires_at = serializers.DateTimeField(read_only=True)
+    user_name = serializers.CharField(source="user_full_name", read_only=True)
+    user_email = serializers.CharField(source="user__email", read_only=True)
+    category_name = serializers.CharField(source="category__name", read_only=True)
+    city_name = serializers.CharField(source="city__name", read_only=True)
+    state_name = serializers.CharField(source="state__name", read_only=True)
+    state_code = serializers.CharField(source="state__code", read_only=True)
+    rejection_reason = serializers.CharField(read_only=True)
+    admin_notes = serializers.CharField(read_only=True)
+    days_ago = serializers.SerializerMethodField()
+    images = AdImageSerializer(many=True, read_only=True)
+    primary_image = AdImageSerializer(read_only=True)
+
+    value_fields = [
+        "id",
+        "title",
+        "description",
+        "price",
+        "status",
+        "plan",
+        "view_count",
+        "contact_count",
+        "favorite_count",
+        "created_at",
+        "updated_at",
+        "expires_at",
+        "user__email",
+        "category__name",
+        "city__name",
+        "state__name",
+        "state__code",
+        "rejection_reason",
+        "admin_notes",
+    ]
+
+    class Meta:
+        list_serializer_class = AdminAdRowListSerializer
+
+    @classmethod
+    def values_queryset(cls, queryset):
+        """Project the queryset down to the columns this serializer reads."""
+        return queryset.values(
+            *cls.value_fields, user_full_name=full_name_expression("user__")
+        )
+
+    @classmethod
+    def load_rows(cls, ad_ids):
+        """
+        Return the rows for ``ad_ids`` in order, reading the cache first.
+
+        Only ads missing from the cache are queried; their rows (images
+        included) are cached for the next request.
+        """
+        generation = admin_ad_rows_generation()
+        keys = {admin_ad_row_key(ad_id, generation): ad_id for ad_id in ad_ids}
+        rows = cache.get_many(list(keys))
+
+        missing = [ad_id for key, ad_id in keys.items() if key not in rows]
+        if missing:
+            fresh = list(cls.values_queryset(Ad.objects.filter(pk__in=missing)))
+            attach_ad_images(fresh)
+            fresh = {admin_ad_row_key(row["id"], generation): row for row in fresh}
+            cache.set_many(fresh, ADMIN_AD_ROW_TIMEOUT)
+            rows.update(fresh)
+
+        return [rows[key] for key in keys if key in rows]
+
+    def to_representation(self, instance):
+        if "images" not in instance:
+            attach_ad_images([instance])
+        return super().to_representation(instance)
+
+    def get_days_ago(self, obj):
+        """Get days since ad was created."""
+        delta = self.get_now() - obj["created_at"]
         return delta.days
 
 
@@ -112,14 +311,15 @@ class AdminAdActionSerializer(serializers.Serializer):
 # ============================================================================
 
 
-class AdminUserSerializer(serializers.ModelSerializer):
+class AdminUserSerializer(TimestampedSerializerMixin, serializers.ModelSerializer):
     """Serializer for admin user management."""
 
-    full_name = serializers.CharField(source="get_full_name", read_only=True)
-    total_ads = serializers.SerializerMethodField()
-    active_ads = serializers.SerializerMethodField()
-    pending_ads = serializers.SerializerMethodField()
-    featured_ads = serializers.SerializerMethodField()
+    # Annotated by AdminUserViewSet.get_queryset()
+    full_name = serializers.CharField(source="full_name_value", read_only=True)
+    total_ads = serializers.IntegerField(source="total_ads_cache", read_only=True)
+    active_ads = serializers.IntegerField(source="active_ads_cache", read_only=True)
+    pending_ads = serializers.IntegerField(source="pending_ads_cache", read_only=True)
+    featured_ads = serializers.IntegerField(source="featured_ads_cache", read_only=True)
     days_since_joined = serializers.SerializerMethodField()
     status_display = serializers.SerializerMethodField()
 
@@ -147,25 +347,39 @@ class AdminUserSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["created_at", "last_login"]
 
-    def get_total_ads(self, obj):
-        return obj.ads.exclude(status="deleted").count()
-
-    def get_active_ads(self, obj):
-        return obj.ads.filter(status="approved").count()
-
-    def get_pending_ads(self, obj):
-        return obj.ads.filter(status="pending").count()
+    # User columns read above; everything else (password, tokens, profile
+    # settings, ...) can stay in the database for list pages
+    model_fields = [
+        "id",
+        "email",
+        "first_name",
+        "last_name",
+        "phone",
+        "is_active",
+        "is_suspended",
+        "suspension_reason",
+        "email_verified",
+        "created_at",
+        "last_login",
+        "total_ads_cache",
+        "active_ads_cache",
+        "pending_ads_cache",
+        "featured_ads_cache",
+    ]
 
-    def get_featured_ads(self, obj):
-        return obj.ads.filter(plan="featured").count()
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """Load only the user columns this serializer reads."""
+        return queryset.only(*cls.model_fields)
 
     def get_days_since_joined(self, obj):
-        from django.utils import timezone
-
-        delta = timezone.now() - obj.created_at
+        delta = self.get_now() - obj.created_at
         return delta.days
 
     def get_status_display(self, obj):
+        # Annotated in SQL for the user list (see with_user_status_display)
+        if hasattr(obj, "status_display"):
+            return obj.status_display
         if not obj.is_active:
             return "banned"
         elif obj.is_suspended:
@@ -192,24 +406,35 @@ class AdminUserActionSerializer(serializers.Serializer):
 # ============================================================================
 
 
-class AdminReportSerializer(serializers.ModelSerializer):
+class AdminReportSerializer(
+    TimestampedSerializerMixin, RepresentationCacheMixin, serializers.ModelSerializer
+):
     """Serializer for admin report management."""
 
-    ad = serializers.SerializerMethodField()
-    reported_by = serializers.SerializerMethodField()
-    reviewed_by = serializers.SerializerMethodField()
-    reason_display = serializers.CharField(source="get_reason_display", read_only=True)
     days_ago = serializers.SerializerMethodField()
 
+    # Response key order; ad, reported_by, reviewed_by and reason_display
+    # are filled in by to_representation() rather than bound fields.
+    representation_fields = [
+        "id",
+        "ad",
+        "reported_by",
+        "reviewed_by",
+        "reason",
+        "reason_display",
+        "description",
+        "is_reviewed",
+        "admin_notes",
+        "created_at",
+        "reviewed_at",
+        "days_ago",
+    ]
+
     class Meta:
         model = AdReport
         fields = [
             "id",
-            "ad",
-            "reported_by",
-            "reviewed_by",
             "reason",
-            "reason_display",
             "description",
             "is_reviewed",
             "admin_notes",
@@ -218,20 +443,66 @@ class AdminReportSerializer(serializers.ModelSerializer):
             "days_ago",
         ]
 
+    # Columns read from the report and the rows it is joined to
+    model_fields = [
+        "id",
+        "reason",
+        "description",
+        "is_reviewed",
+        "admin_notes",
+        "created_at",
+        "reviewed_at",
+        "ad__id",
+        "ad__title",
+        "ad__slug",
+        "ad__status",
+        "reported_by__id",
+        "reported_by__email",
+        "reported_by__first_name",
+        "reported_by__last_name",
+        "reviewed_by__id",
+        "reviewed_by__email",
+    ]
+
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """Load every relation this serializer reads in a fixed number of queries."""
+        return queryset.select_related(
+            "ad", "reported_by", "reviewed_by"
+        ).only(*cls.model_fields).prefetch_related(
+            # Only the first image of each ad is shown; the sliced prefetch
+            # fetches one row per ad instead of the whole gallery
+            Prefetch(
+                "ad__images",
+                queryset=AdImage.objects.only("id", "ad_id", "image")[:1],
+                to_attr="prefetched_images",
+            )
+        )
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data["ad"] = self.get_ad(instance)
+        data["reported_by"] = self.get_reported_by(instance)
+        data["reviewed_by"] = self.get_reviewed_by(instance)
+        data["reason_display"] = str(
+            AdReport.REASON_LABELS.get(instance.reason, instance.reason)
+        )
+        return {name: data[name] for name in self.representation_fields}
+
     def get_ad(self, obj):
         """Return ad details as nested object."""
         if obj.ad:
             # Get first image if available
-            first_image = obj.ad.images.first()
+            if hasattr(obj.ad, "prefetched_images"):
+                images = obj.ad.prefetched_images
+                first_image = images[0] if images else None
+            else:
+                first_image = obj.ad.images.first()
             image_url = None
             if first_image and first_image.image:
-                from django.conf import settings
-
-                image_url = (
-                    settings.MEDIA_URL + str(first_image.image)
-                    if not str(first_image.image).startswith("http")
-                    else str(first_image.image)
-                )
+                # Some images store an absolute URL instead of a media path
+                name = first_image.image.name
+                image_url = name if name.startswith("http") else first_image.image.url
 
             return {
                 "id": obj.ad.id,
@@ -245,26 +516,32 @@ class AdminReportSerializer(serializers.ModelSerializer):
     def get_reported_by(self, obj):
         """Return reporter details as nested object."""
         if obj.reported_by:
-            return {
-                "id": obj.reported_by.id,
-                "email": obj.reported_by.email,
-                "full_name": obj.reported_by.get_full_name(),
-            }
+            return self.get_cached_representation(
+                "reported_by",
+                obj.reported_by,
+                lambda user: {
+                    "id": user.id,
+                    "email": user.email,
+                    "full_name": user.get_full_name(),
+                },
+            )
         return None
 
     def get_reviewed_by(self, obj):
         """Return reviewer details as nested object."""
         if obj.reviewed_by:
-            return {
-                "id": obj.reviewed_by.id,
-                "email": obj.reviewed_by.email,
-            }
+            return self.get_cached_representation(
+                "reviewed_by",
+                obj.reviewed_by,
+                lambda user: {
+                    "id": user.id,
+                    "email": user.email,
+                },
+            )
         return None
 
     def get_days_ago(self, obj):
-        from django.utils import timezone
-
-        delta = timezone.now() - obj.created_at
+        delta = self.get_now() - obj.created_at
         return delta.days
 
 
@@ -293,8 +570,8 @@ class AdminBannerSerializer(serializers.ModelSerializer):
     created_by_name = serializers.CharField(
         source="created_by.get_full_name", read_only=True
     )
-    ctr = serializers.ReadOnlyField()
-    is_currently_active = serializers.ReadOnlyField()
+    ctr = serializers.SerializerMethodField()
+    is_currently_active = serializers.SerializerMethodField()
     target_states_display = serializers.SerializerMethodField()
     target_categories_display = serializers.SerializerMethodField()
 
@@ -335,6 +612,26 @@ class AdminBannerSerializer(serializers.ModelSerializer):
             "clicks",
         ]
 
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """Load every relation this serializer reads in a fixed number of queries."""
+        return queryset.select_related("created_by").prefetch_related(
+            Prefetch("target_states", queryset=State.objects.only("id", "name")),
+            Prefetch(
+                "target_categories", queryset=Category.objects.only("id", "name")
+            ),
+        )
+
+    def get_ctr(self, obj):
+        if hasattr(obj, "ctr_value"):
+            return obj.ctr_value if obj.ctr_value is not None else 0
+        return obj.ctr
+
+    def get_is_currently_active(self, obj):
+        if hasattr(obj, "currently_active"):
+            return obj.currently_active
+        return obj.is_currently_active()
+
     def get_target_states_display(self, obj):
         return [
             {"id": state.id, "name": state.name} for state in obj.target_states.all()
@@ -378,8 +675,8 @@ class AdminBannerSerializer(serializers.ModelSerializer):
 class AdminStateSerializer(serializers.ModelSerializer):
     """Serializer for admin state management."""
 
-    total_ads = serializers.SerializerMethodField(read_only=True)
-    active_ads = serializers.SerializerMethodField(read_only=True)
+    total_ads = serializers.IntegerField(source="total_ads_cache", read_only=True)
+    active_ads = serializers.IntegerField(source="active_ads_cache", read_only=True)
     users_count = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
@@ -401,66 +698,54 @@ class AdminStateSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
+        # Uniqueness is checked together in validate(); the database unique
+        # constraints remain the final guard.
+        extra_kwargs = {
+            "code": {"validators": []},
+            "domain": {"validators": []},
+            "name": {"validators": []},
+        }
 
     def validate_code(self, value):
-        """Validate state code is unique and uppercase."""
-        value = value.upper()
-        instance = self.instance
-        
-        # Check if code already exists (excluding current instance for updates)
-        if instance:
-            if State.objects.exclude(id=instance.id).filter(code=value).exists():
-                raise serializers.ValidationError(f"State with code '{value}' already exists")
-        else:
-            if State.objects.filter(code=value).exists():
-                raise serializers.ValidationError(f"State with code '{value}' already exists")
-        
-        return value
-
-    def validate_domain(self, value):
-        """Validate domain is unique."""
-        instance = self.instance
-        
-        # Check if domain already exists (excluding current instance for updates)
-        if instance:
-            if State.objects.exclude(id=instance.id).filter(domain=value).exists():
-                raise serializers.ValidationError(f"State with domain '{value}' already exists")
-        else:
-            if State.objects.filter(domain=value).exists():
-                raise serializers.ValidationError(f"State with domain '{value}' already exists")
-        
-        return value
-
-    def validate_name(self, value):
-        """Validate name is unique."""
-        instance = self.instance
-        
-        # Check if name already exists (excluding current instance for updates)
-        if instance:
-            if State.objects.exclude(id=instance.id).filter(name=value).exists():
-                raise serializers.ValidationError(f"State with name '{value}' already exists")
-        else:
-            if State.objects.filter(name=value).exists():
-                raise serializers.ValidationError(f"State with name '{value}' already exists")
-        
-        return value
+        """Normalize state code to uppercase."""
+        return value.upper()
 
-    def get_total_ads(self, obj):
-        return obj.ads.exclude(status="deleted").count()
+    def validate(self, data):
+        """Validate code, domain and name are unique in a single query."""
+        lookups = Q()
+        for field in ("code", "domain", "name"):
+            if field in data:
+                lookups |= Q(**{field: data[field]})
+
+        if lookups:
+            existing = State.objects.filter(lookups)
+            if self.instance:
+                existing = existing.exclude(id=self.instance.id)
+
+            errors = {}
+            for row in existing.values("code", "domain", "name"):
+                for field in ("code", "domain", "name"):
+                    if field in data and row[field] == data[field]:
+                        errors[field] = [
+                            f"State with {field} '{data[field]}' already exists"
+                        ]
+            if errors:
+                raise serializers.ValidationError(errors)
 
-    def get_active_ads(self, obj):
-        return obj.ads.filter(status="approved").count()
+        return data
 
     def get_users_count(self, obj):
+        if hasattr(obj, "users_count"):
+            return obj.users_count
         return obj.ads.values("user").distinct().count()
 
 
 class AdminCategorySerializer(serializers.ModelSerializer):
     """Serializer for admin category management."""
 
-    total_ads = serializers.SerializerMethodField()
-    active_ads = serializers.SerializerMethodField()
-    pending_ads = serializers.SerializerMethodField()
+    total_ads = serializers.IntegerField(source="total_ads_cache", read_only=True)
+    active_ads = serializers.IntegerField(source="active_ads_cache", read_only=True)
+    pending_ads = serializers.IntegerField(source="pending_ads_cache", read_only=True)
 
     class Meta:
         model = Category
@@ -477,21 +762,12 @@ class AdminCategorySerializer(serializers.ModelSerializer):
             "pending_ads",
         ]
 
-    def get_total_ads(self, obj):
-        return obj.ads.exclude(status="deleted").count()
-
-    def get_active_ads(self, obj):
-        return obj.ads.filter(status="approved").count()
-
-    def get_pending_ads(self, obj):
-        return obj.ads.filter(status="pending").count()
-
 
 class AdminCitySerializer(serializers.ModelSerializer):
     """Serializer for admin city management."""
 
     state_name = serializers.CharField(source="state.name", read_only=True)
-    total_ads = serializers.SerializerMethodField()
+    total_ads = serializers.IntegerField(source="total_ads_cache", read_only=True)
 
     class Meta:
         model = City
@@ -505,9 +781,6 @@ class AdminCitySerializer(serializers.ModelSerializer):
             "total_ads",
         ]
 
-    def get_total_ads(self, obj):
-        return obj.ads.exclude(status="deleted").count()
-
 
 # ============================================================================
 # SETTINGS SERIALIZERS
@@ -635,6 +908,49 @@ class TopUserSerializer(serializers.Serializer):
 # ============================================================================
 
 
+class IntIdsField(serializers.ListField):
+    """
+    List of integer ids validated in one pass.
+
+    Casts the whole list at once instead of running a child IntegerField
+    over every element.
+    """
+
+    default_error_messages = {
+        "invalid_id": "ids must be positive integers",
+    }
+
+    # Largest value a BIGINT primary key can hold
+    MAX_ID = 2**63 - 1
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("min_length", 1)
+        super().__init__(**kwargs)
+
+    def to_int(self, value):
+        # int() alone would accept True and truncate 1.9 to id 1
+        if isinstance(value, bool):
+            self.fail("invalid_id")
+        if isinstance(value, float) and not value.is_integer():
+            self.fail("invalid_id")
+        try:
+            id_value = int(value)
+        except (TypeError, ValueError, OverflowError):
+            self.fail("invalid_id")
+        if not 1 <= id_value <= self.MAX_ID:
+            self.fail("invalid_id")
+        return id_value
+
+    def to_internal_value(self, data):
+        if html.is_html_input(data):
+            data = html.parse_html_list(data, default=[])
+        if isinstance(data, (str, Mapping)) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+
+        # min_length/max_length are enforced by the validators ListField adds
+        return [self.to_int(value) for value in data]
+
+
 class BulkAdActionSerializer(serializers.Serializer):
     """Serializer for bulk ad actions."""
 
@@ -646,9 +962,7 @@ class BulkAdActionSerializer(serializers.Serializer):
         ("unfeature", "Unfeature Selected"),
     ]
 
-    ad_ids = serializers.ListField(
-        child=serializers.IntegerField(), min_length=1, max_length=100
-    )
+    ad_ids = IntIdsField()
     action = serializers.ChoiceField(choices=ACTION_CHOICES)
     reason = serializers.CharField(required=False, allow_blank=True, max_length=500)
     admin_notes = serializers.CharField(
@@ -665,8 +979,6 @@ class BulkUserActionSerializer(serializers.Serializer):
         ("activate", "Activate Selected"),
     ]
 
-    user_ids = serializers.ListField(
-        child=serializers.IntegerField(), min_length=1, max_length=50
-    )
+    user_ids = IntIdsField()
     action = serializers.ChoiceField(choices=ACTION_CHOICES)
     reason = serializers.CharField(required=False, allow_blank=True, max_length=500)
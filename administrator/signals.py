@@ -0,0 +1,112 @@
+# administrator/signals.py
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from accounts.models import User
+from ads.models import Ad, AdImage, AdView
+from ads.signals import COUNTED_UPDATE_FIELDS
+from content.models import Category, City, State
+from .cache_utils import (
+    ADMIN_SETTINGS_CACHE_KEY,
+    admin_user_state_key,
+    bump_admin_ad_rows_generation,
+    invalidate_admin_ad_rows,
+    invalidate_admin_stats,
+)
+from .models import AdminSettings, CategorySummary
+
+# User fields shown in cached admin figures (status counts, top users)
+USER_STATS_FIELDS = {"is_active", "is_suspended", "first_name", "last_name", "email"}
+
+# Fields of related rows that are copied into cached admin ad list rows
+AD_ROW_RELATED_FIELDS = {
+    User: {"first_name", "last_name", "email"},
+    Category: {"name"},
+    City: {"name"},
+    State: {"name", "code"},
+}
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_admin_user_state(sender, instance, **kwargs):
+    """Drop the cached admin state so token checks see the latest user flags."""
+    cache.delete(admin_user_state_key(instance.pk))
+
+
+@receiver(post_save, sender=AdminSettings)
+@receiver(post_delete, sender=AdminSettings)
+def invalidate_admin_settings(sender, instance, **kwargs):
+    """
+    Drop the cached settings response whenever the settings row changes,
+    and the admin figures priced from it (revenue analytics).
+    """
+    cache.delete(ADMIN_SETTINGS_CACHE_KEY)
+    invalidate_admin_stats()
+
+
+@receiver(post_save, sender=Ad)
+@receiver(post_delete, sender=Ad)
+def invalidate_admin_ad_row(sender, instance, **kwargs):
+    """Drop the cached admin list row of a changed ad."""
+    invalidate_admin_ad_rows([instance.pk])
+
+
+@receiver(post_save, sender=AdImage)
+@receiver(post_delete, sender=AdImage)
+def invalidate_admin_ad_row_images(sender, instance, **kwargs):
+    """Drop the cached admin list row of the ad whose images changed."""
+    invalidate_admin_ad_rows([instance.ad_id])
+
+
+def invalidate_admin_ad_rows_for_related(sender, instance, update_fields=None, **kwargs):
+    """Invalidate every cached ad row when a name copied into them may have changed."""
+    if update_fields is not None and not AD_ROW_RELATED_FIELDS[sender].intersection(
+        update_fields
+    ):
+        return
+    bump_admin_ad_rows_generation()
+
+
+for model in AD_ROW_RELATED_FIELDS:
+    post_save.connect(invalidate_admin_ad_rows_for_related, sender=model)
+    post_delete.connect(invalidate_admin_ad_rows_for_related, sender=model)
+
+
+@receiver(post_save, sender=Ad)
+@receiver(post_delete, sender=Ad)
+def invalidate_admin_stats_for_ad(sender, instance, update_fields=None, **kwargs):
+    """Drop cached admin figures when an ad change may move a count."""
+    if update_fields is not None and not COUNTED_UPDATE_FIELDS.intersection(update_fields):
+        return
+    invalidate_admin_stats()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_admin_stats_for_user(sender, instance, update_fields=None, **kwargs):
+    """Drop cached admin figures when a user change may show up in them."""
+    if update_fields is not None and not USER_STATS_FIELDS.intersection(update_fields):
+        return
+    invalidate_admin_stats()
+
+
+@receiver(post_save, sender=State)
+@receiver(post_delete, sender=State)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_admin_stats_for_catalog(sender, instance, **kwargs):
+    """Drop cached admin figures listing states and categories."""
+    invalidate_admin_stats()
+
+
+@receiver(post_save, sender=AdView)
+def count_category_summary_view(sender, instance, created, **kwargs):
+    """Add a newly recorded view to its category's summary total."""
+    if not created:
+        return
+    CategorySummary.objects.filter(category_id=instance.ad.category_id).update(
+        total_views=F("total_views") + 1
+    )
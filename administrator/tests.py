@@ -1,3 +1,851 @@
-from django.test import TestCase
+import csv
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from ads.models import Ad, AdContact, AdImage, AdReport, AdView
+from content.models import Category, City, State
+
+from . import urls
+from .auth_views import ADMIN_LOGIN_MAX_ATTEMPTS
+from .cache_utils import (
+    ADMIN_CATALOG_TIMEOUT,
+    ADMIN_SETTINGS_CACHE_KEY,
+    ADMIN_SETTINGS_TIMEOUT,
+    get_featured_ad_price,
+)
+from .analytics import (
+    activity_series,
+    banner_series,
+    refresh_banner_daily_stats,
+    refresh_category_summaries,
+    refresh_daily_activity,
+)
+from .models import Banner, BannerClick, BannerImpression, CategorySummary
+from .serializers import BulkAdActionSerializer
+from .views import BULK_ACTION_BATCH_SIZE
+
+User = get_user_model()
+
+
+class AdminAPITestCase(APITestCase):
+    """Admin client plus a small catalogue of states, cities and users."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            email="admin@example.com", password="pw12345678",
+            first_name="Admin", last_name="User",
+        )
+        cls.states = [
+            State.objects.create(
+                name=name, code=code, domain=f"{code.lower()}.example.com",
+                logo="logo.png", meta_title=name, meta_description=name,
+            )
+            for name, code in [("Illinois", "IL"), ("Texas", "TX")]
+        ]
+        cls.cities = [
+            City.objects.create(name=f"City {i}", state=state)
+            for i, state in enumerate(cls.states)
+        ]
+        cls.categories = [
+            Category.objects.create(name=f"Category {i}", icon="icon")
+            for i in range(2)
+        ]
+        cls.users = [
+            User.objects.create_user(
+                email=f"user{i}@example.com", password="pw12345678",
+                first_name="First", last_name=f"Last {i}",
+            )
+            for i in range(2)
+        ]
+
+    def setUp(self):
+        # Admin stats and rows are cached across requests
+        cache.clear()
+        self.client.force_authenticate(self.admin)
+
+    def create_ad(self, index=0, **fields):
+        city = self.cities[index]
+        values = {
+            "title": "Ad",
+            "description": "Description " * 5,
+            "user": self.users[index],
+            "category": self.categories[index],
+            "city": city,
+            "state": city.state,
+            "price": 10,
+            **fields,
+        }
+        return Ad.objects.create(**values)
+
+    def cursor_pages(self, name, **params):
+        """Follow the keyset pages of list ``name``; return ids and queries."""
+        url, query = reverse(name), {"cursor": "", "page_size": 2, **params}
+        ids, queries = [], []
+        while url:
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(url, query)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("count", response.data)
+            ids += [row["id"] for row in response.data["results"]]
+            queries += [entry["sql"] for entry in captured.captured_queries]
+            url, query = response.data["next"], None
+        return ids, queries
+
+    def page_number_ids(self, name, **params):
+        response = self.client.get(reverse(name), {"page_size": 200, **params})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], len(response.data["results"]))
+        return [row["id"] for row in response.data["results"]]
+
+    def assertKeysetPagesMatch(self, name, **params):
+        """Keyset pages list the same rows as page numbers, without a COUNT."""
+        ids, queries = self.cursor_pages(name, **params)
+        self.assertEqual(ids, self.page_number_ids(name, **params))
+        self.assertFalse([sql for sql in queries if "COUNT(" in sql])
+
+
+
+def url_names(patterns):
+    """Names of ``patterns`` and the patterns they include."""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from url_names(pattern.url_patterns)
+        # The router repeats each route's name on its format suffix variant
+        elif pattern.name and "format>" not in str(pattern.pattern):
+            yield pattern.name
+
+
+class URLTests(SimpleTestCase):
+    def test_url_names_are_unique(self):
+        names = list(url_names(urls.urlpatterns))
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_routes_resolve(self):
+        # The router names the bulk ad action after the viewset basename
+        self.assertEqual(
+            reverse("admin-ads-bulk-action"), "/api/administrator/ads/bulk_action/"
+        )
+        for name in [
+            "admin-users-bulk-action",
+            "admin-reports-bulk-action",
+            "admin-analytics-overview",
+            "admin-export-ads",
+            "admin-settings",
+        ]:
+            self.assertTrue(reverse(name).startswith("/api/administrator/"), name)
+
+
+class BulkActionTests(AdminAPITestCase):
+    def test_ids_must_be_positive_integers(self):
+        for ad_ids in [[1.9], [True], ["1.5"], [0], [-3], ["x"], [None], [2**63]]:
+            serializer = BulkAdActionSerializer(
+                data={"ad_ids": ad_ids, "action": "approve"}
+            )
+            self.assertFalse(serializer.is_valid(), ad_ids)
+            self.assertIn("ad_ids", serializer.errors)
+
+    def test_integral_ids_are_accepted(self):
+        serializer = BulkAdActionSerializer(
+            data={"ad_ids": [1, "2", 3.0], "action": "approve"}
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data["ad_ids"], [1, 2, 3])
+
+    def test_ad_bulk_action_rejects_invalid_ids(self):
+        ad = self.create_ad(status="pending")
+        response = self.client.post(
+            reverse("admin-ads-bulk-action"),
+            {"ad_ids": [ad.pk + 0.5], "action": "approve"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("ad_ids", response.data["details"])
+        ad.refresh_from_db()
+        self.assertEqual(ad.status, "pending")
+
+    def test_ad_bulk_action_rejects_unknown_action(self):
+        ad = self.create_ad(status="pending")
+        response = self.client.post(
+            reverse("admin-ads-bulk-action"),
+            {"ad_ids": [ad.pk], "action": "publish"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("action", response.data["details"])
+
+    def test_ad_bulk_action(self):
+        ads = [self.create_ad(i % 2, status="pending") for i in range(3)]
+        response = self.client.post(
+            reverse("admin-ads-bulk-action"),
+            {"ad_ids": [ad.pk for ad in ads[:2]], "action": "approve"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated_count"], 2)
+        self.assertEqual(
+            sorted(Ad.objects.values_list("status", flat=True)),
+            ["approved", "approved", "pending"],
+        )
+
+    def test_selection_size_is_not_capped(self):
+        ads = [self.create_ad(status="pending") for _ in range(3)]
+        unknown_ids = range(ads[-1].pk + 1, ads[-1].pk + 200)
+        response = self.client.post(
+            reverse("admin-ads-bulk-action"),
+            {"ad_ids": [ad.pk for ad in ads] + list(unknown_ids), "action": "approve"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated_count"], 3)
+
+        response = self.client.post(
+            reverse("admin-users-bulk-action"),
+            {"user_ids": [self.users[0].pk, *range(10_000, 10_100)], "action": "suspend"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated_count"], 1)
+
+    def test_user_bulk_action_rejects_invalid_ids(self):
+        response = self.client.post(
+            reverse("admin-users-bulk-action"),
+            {"user_ids": [False], "action": "ban"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("user_ids", response.data["details"])
+
+    def test_user_bulk_action(self):
+        response = self.client.post(
+            reverse("admin-users-bulk-action"),
+            {"user_ids": [self.users[0].pk], "action": "suspend", "reason": "spam"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.users[0].refresh_from_db()
+        self.assertTrue(self.users[0].is_suspended)
+        self.assertEqual(self.users[0].suspension_reason, "spam")
+
+
+class BannerToggleTests(AdminAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.banner = Banner.objects.create(
+            title="Banner", position="header", banner_type="text",
+            text_content="Text", created_by=self.admin,
+        )
+
+    def toggle(self, pk):
+        return self.client.post(reverse("admin-banners-toggle", args=[pk]))
+
+    def test_toggle(self):
+        response = self.toggle(self.banner.pk)
+        self.assertEqual(response.status_code, 200)
+        self.assertIs(response.data["is_active"], not self.banner.is_active)
+
+        response = self.toggle(self.banner.pk)
+        self.assertIs(response.data["is_active"], self.banner.is_active)
+        self.banner.refresh_from_db()
+        self.assertIs(self.banner.is_active, response.data["is_active"])
+
+    def test_toggle_queries(self):
+        # The locked read of the row and the UPDATE
+        with CaptureQueriesContext(connection) as captured:
+            self.toggle(self.banner.pk)
+        # The test case's transaction turns the atomic block into a savepoint
+        statements = [
+            entry["sql"] for entry in captured.captured_queries
+            if "SAVEPOINT" not in entry["sql"]
+        ]
+        self.assertEqual(len(statements), 2, statements)
+
+    def test_missing_banner(self):
+        self.assertEqual(self.toggle(self.banner.pk + 1).status_code, 404)
+        self.assertEqual(self.toggle("abc").status_code, 404)
+
+    def test_requires_admin(self):
+        self.client.force_authenticate(self.users[0])
+        self.assertEqual(self.toggle(self.banner.pk).status_code, 403)
+        self.banner.refresh_from_db()
+        self.assertTrue(self.banner.is_active)
+
+
+class AnalyticsParameterTests(AdminAPITestCase):
+    def get(self, name, **params):
+        return self.client.get(reverse(f"admin-analytics-{name}"), params)
+
+    def test_invalid_days_is_a_bad_request(self):
+        for name in ["overview", "users", "revenue"]:
+            for days in ["abc", "0", "-5", "1.5", "99999999"]:
+                response = self.get(name, days=days)
+                self.assertEqual(response.status_code, 400, (name, days))
+
+    def test_views_without_days_ignore_it(self):
+        for name in ["geographic", "categories"]:
+            response = self.get(name, days="abc")
+            self.assertEqual(response.status_code, 200, name)
+
+    def test_errors_are_not_cached(self):
+        self.assertEqual(self.get("overview", days="abc").status_code, 400)
+        self.assertEqual(self.get("overview", days="abc").status_code, 400)
+        self.assertEqual(self.get("overview", days="7").status_code, 200)
+
+    def test_responses_are_cached_per_parameters(self):
+        self.create_ad(status="approved")
+        self.get("overview", days="7")
+        with self.assertNumQueries(0):
+            self.get("overview", days="7")
+        with self.assertNumQueries(3):
+            self.get("overview", days="7", state="IL")
+
+
+class GeographicAnalyticsTests(AdminAPITestCase):
+    def test_distribution_matches_live_ad_counts(self):
+        for index, status in enumerate(["approved", "pending", "rejected", "deleted"]):
+            self.create_ad(index % 2, status=status)
+            self.create_ad(0, status=status)
+        moved = self.create_ad(0, status="approved")
+        moved.city = self.cities[1]
+        moved.state = self.states[1]
+        moved.save()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("admin-analytics-geographic"))
+        self.assertEqual(response.status_code, 200)
+
+        live_ads = Ad.objects.exclude(status="deleted").order_by()
+        live_states = dict(
+            live_ads.values_list("state__code").annotate(count=Count("pk"))
+        )
+        live_cities = dict(
+            live_ads.values_list("city__name").annotate(count=Count("pk"))
+        )
+        self.assertEqual(
+            {row["state__code"]: row["count"] for row in response.data["state_distribution"]},
+            live_states,
+        )
+        self.assertEqual(
+            {row["city__name"]: row["count"] for row in response.data["top_cities"]},
+            live_cities,
+        )
+
+
+class AdRowCacheTests(AdminAPITestCase):
+    def list_ads(self):
+        response = self.client.get(reverse("admin-ads-list"))
+        self.assertEqual(response.status_code, 200)
+        return {row["id"]: row for row in response.data["results"]}
+
+    def test_warm_page_reads_rows_from_cache(self):
+        for index in range(3):
+            self.create_ad(index % 2, status="approved")
+        self.list_ads()
+
+        # The count and the id query; rows and images come from the cache
+        with self.assertNumQueries(2):
+            self.list_ads()
+
+    def test_saved_ad_row_is_refreshed(self):
+        ad = self.create_ad(status="pending")
+        self.list_ads()
+
+        ad.title = "Renamed"
+        ad.save()
+        self.assertEqual(self.list_ads()[ad.pk]["title"], "Renamed")
+
+    def test_bulk_action_refreshes_rows(self):
+        ad = self.create_ad(status="pending")
+        self.list_ads()
+
+        self.client.post(
+            reverse("admin-ads-bulk-action"),
+            {"ad_ids": [ad.pk], "action": "approve"},
+            format="json",
+        )
+        self.assertEqual(self.list_ads()[ad.pk]["status"], "approved")
+
+    def test_related_names_retire_every_row(self):
+        ad = self.create_ad(status="pending")
+        self.list_ads()
+
+        self.categories[0].name = "Renamed category"
+        self.categories[0].save()
+        self.users[0].first_name = "Renamed"
+        self.users[0].save()
+        row = self.list_ads()[ad.pk]
+        self.assertEqual(row["category_name"], "Renamed category")
+        self.assertEqual(row["user_name"], "Renamed Last 0")
+
+
+class DashboardStatsCacheTests(AdminAPITestCase):
+    def get_stats(self, **params):
+        response = self.client.get(reverse("admin-dashboard-stats"), params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_stats_are_cached_per_state(self):
+        self.create_ad(status="approved")
+        self.create_ad(1, status="pending")
+        self.assertEqual(self.get_stats()["ads"]["total"], 2)
+        with self.assertNumQueries(0):
+            self.get_stats()
+
+        self.assertEqual(self.get_stats(state="TX")["ads"]["total"], 1)
+
+    def test_admin_actions_retire_cached_stats(self):
+        ad = self.create_ad(status="pending")
+        self.assertEqual(self.get_stats()["ads"]["pending"], 1)
+
+        self.client.post(
+            reverse("admin-ads-bulk-action"),
+            {"ad_ids": [ad.pk], "action": "approve"},
+            format="json",
+        )
+        stats = self.get_stats()
+        self.assertEqual(stats["ads"]["pending"], 0)
+        self.assertEqual(stats["ads"]["active"], 1)
+
+        self.client.post(
+            reverse("admin-users-bulk-action"),
+            {"user_ids": [self.users[0].pk], "action": "ban"},
+            format="json",
+        )
+        self.assertEqual(self.get_stats()["users"]["banned"], 1)
+
+
+class CatalogStatsCacheTests(AdminAPITestCase):
+    def list_states(self):
+        response = self.client.get(reverse("admin-states-list"))
+        self.assertEqual(response.status_code, 200)
+        return {state["code"]: state for state in response.data["results"]}
+
+    def category_stats(self, **params):
+        response = self.client.get(reverse("admin-categories-stats"), params)
+        self.assertEqual(response.status_code, 200)
+        return {row["id"]: row for row in response.data["categories"]}
+
+    def test_state_list_is_cached(self):
+        self.list_states()
+        with self.assertNumQueries(0):
+            states = self.list_states()
+        self.assertTrue(states["IL"]["logo"].startswith("http://testserver/"))
+
+    def test_state_list_follows_ads_and_state_changes(self):
+        self.assertEqual(self.list_states()["IL"]["total_ads"], 0)
+
+        self.create_ad(status="approved")
+        self.assertEqual(self.list_states()["IL"]["active_ads"], 1)
+
+        self.states[0].meta_title = "Renamed"
+        self.states[0].save()
+        self.assertEqual(self.list_states()["IL"]["meta_title"], "Renamed")
+
+    def test_category_stats_are_cached_per_state(self):
+        self.create_ad(status="approved")
+        self.create_ad(1, status="pending")
+        self.category_stats()
+        with self.assertNumQueries(0):
+            self.category_stats()
+
+        stats = self.category_stats(state="TX")
+        self.assertEqual(stats[self.categories[0].pk]["total_ads"], 0)
+        self.assertEqual(stats[self.categories[1].pk]["pending_ads"], 1)
+
+    def test_category_stats_follow_ad_and_category_changes(self):
+        ad = self.create_ad(status="pending")
+        self.category_stats()
+
+        ad.status = "approved"
+        ad.save()
+        stats = self.category_stats()
+        self.assertEqual(stats[self.categories[0].pk]["active_ads"], 1)
+
+        self.categories[1].is_active = False
+        self.categories[1].save()
+        self.assertNotIn(self.categories[1].pk, self.category_stats())
+
+    def test_cached_state_list_expires(self):
+        self.list_states()
+
+        # A state saved in another process does not bump this one's
+        # generation; the entries time out instead
+        State.objects.filter(pk=self.states[0].pk).update(meta_title="Renamed")
+        later = time.time() + ADMIN_CATALOG_TIMEOUT + 1
+        with mock.patch("django.core.cache.backends.locmem.time.time", return_value=later):
+            self.assertEqual(self.list_states()["IL"]["meta_title"], "Renamed")
+
+
+class UserAndReportKeysetPaginationTests(AdminAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        for index in range(5):
+            User.objects.create_user(
+                email=f"reader{index}@example.com", password="pw12345678",
+                first_name=f"Reader {index % 2}", last_name="Last",
+            )
+
+    def test_user_pages(self):
+        self.assertKeysetPagesMatch("admin-users-list")
+        self.assertKeysetPagesMatch("admin-users-list", ordering="email")
+
+    def test_report_pages(self):
+        ads = [self.create_ad(index % 2, status="approved") for index in range(3)]
+        for ad in ads:
+            for index, reason in enumerate(["spam", "fraud"]):
+                AdReport.objects.create(
+                    ad=ad, reported_by=self.users[index], reason=reason,
+                    description="Report",
+                )
+        self.assertKeysetPagesMatch("admin-reports-list")
+        self.assertKeysetPagesMatch("admin-reports-list", ordering="created_at")
+
+
+class BannerKeysetPaginationTests(AdminAPITestCase):
+    def test_banner_pages(self):
+        for index in range(5):
+            Banner.objects.create(
+                title=f"Banner {index}", position="header", banner_type="text",
+                text_content="Text", created_by=self.admin, impressions=10 * index,
+            )
+        self.assertKeysetPagesMatch("admin-banners-list")
+        self.assertKeysetPagesMatch("admin-banners-list", ordering="-impressions")
+
+
+class AdKeysetPaginationTests(AdminAPITestCase):
+    def test_ad_pages(self):
+        for index in range(5):
+            self.create_ad(
+                index % 2, status="approved", title=f"Ad {index}", price=100 - index
+            )
+        self.assertKeysetPagesMatch("admin-ads-list")
+        self.assertKeysetPagesMatch("admin-ads-list", ordering="title")
+        self.assertKeysetPagesMatch("admin-ads-list", ordering="price")
+
+    def test_ad_pages_are_filtered(self):
+        for status in ["approved", "pending", "approved", "rejected"]:
+            self.create_ad(status=status)
+        ids, _ = self.cursor_pages("admin-ads-list", status="approved")
+        self.assertEqual(len(ids), 2)
+
+
+class ChunkedBulkActionTests(AdminAPITestCase):
+    def test_large_selections_are_updated_in_slices(self):
+        ads = [self.create_ad(index % 2, status="pending") for index in range(5)]
+        # Ids past the last ad match nothing but fill the later slices
+        ad_ids = [ad.pk for ad in ads] + list(
+            range(ads[-1].pk + 1, ads[-1].pk + BULK_ACTION_BATCH_SIZE + 1)
+        )
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(
+                reverse("admin-ads-bulk-action"),
+                {"ad_ids": ad_ids, "action": "approve"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated_count"], 5)
+        self.assertFalse(Ad.objects.exclude(status="approved").exists())
+
+        ad_updates = [
+            entry["sql"] for entry in captured.captured_queries
+            if entry["sql"].startswith('UPDATE "ads_ad"')
+        ]
+        self.assertEqual(len(ad_updates), 2)
+
+        # Every slice's counter changes were applied
+        for state in self.states:
+            state.refresh_from_db()
+        self.assertEqual([state.active_ads_cache for state in self.states], [3, 2])
+        self.assertEqual([state.pending_ads_cache for state in self.states], [0, 0])
+
+
+class DailyActivityRollupTests(AdminAPITestCase):
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        for offset in range(12):
+            ad = self.create_ad(
+                offset % 2, status=["approved", "pending", "deleted"][offset % 3]
+            )
+            created = now - timedelta(days=offset * 3, hours=offset)
+            Ad.objects.filter(pk=ad.pk).update(created_at=created)
+            for hours in range(offset % 4):
+                view = AdView.objects.create(
+                    ad=ad, ip_address="1.1.1.1", session_id=f"session-{hours}"
+                )
+                AdView.objects.filter(pk=view.pk).update(
+                    viewed_at=created + timedelta(hours=hours * 20)
+                )
+            contact = AdContact.objects.create(
+                ad=ad, ip_address="1.1.1.1", contact_type="phone"
+            )
+            AdContact.objects.filter(pk=contact.pk).update(viewed_at=created)
+
+    def test_rollup_matches_live_counts(self):
+        start = timezone.now() - timedelta(days=30)
+        live = {
+            state: activity_series(start, state) for state in ["all", "IL", "TX"]
+        }
+        self.assertGreater(refresh_daily_activity(40), 0)
+        for state, series in live.items():
+            self.assertEqual(activity_series(start, state), series, state)
+
+    def test_partial_rollup_falls_back_to_live_counts(self):
+        start = timezone.now() - timedelta(days=30)
+        live = activity_series(start)
+        refresh_daily_activity(10)
+        self.assertEqual(activity_series(start), live)
+
+    def test_overview_reads_closed_days_from_rollup(self):
+        url = reverse("admin-analytics-overview")
+        live = self.client.get(url, {"days": 30}).data
+        call_command("refresh_analytics", days=40, stdout=StringIO())
+
+        cache.clear()
+        with CaptureQueriesContext(connection) as captured:
+            rolled_up = self.client.get(url, {"days": 30}).data
+        self.assertEqual(rolled_up, live)
+        self.assertTrue(
+            any("administrator_dailyactivity" in entry["sql"] for entry in captured)
+        )
+
+
+class CategorySummaryTests(AdminAPITestCase):
+    def get_categories(self):
+        cache.clear()
+        response = self.client.get(reverse("admin-analytics-categories"))
+        self.assertEqual(response.status_code, 200)
+        return response.data["categories"]
+
+    def test_summaries_match_live_totals(self):
+        for index, price in enumerate([10, 25, None, 40]):
+            ad = self.create_ad(index % 2, status="approved", price=price)
+            Ad.objects.filter(pk=ad.pk).update(view_count=index * 7)
+        live = self.get_categories()
+
+        self.assertEqual(refresh_category_summaries(), len(self.categories))
+        with self.assertNumQueries(2):
+            self.assertEqual(self.get_categories(), live)
+
+    def test_refresh_replaces_summaries(self):
+        self.create_ad(status="approved", price=10)
+        refresh_category_summaries()
+        self.create_ad(status="approved", price=30)
+        refresh_category_summaries()
+
+        row = next(
+            row for row in self.get_categories() if row["id"] == self.categories[0].pk
+        )
+        self.assertEqual(row["avg_price"], 20)
+        self.assertEqual(CategorySummary.objects.count(), len(self.categories))
+
+
+class BannerDailyStatsTests(AdminAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.banners = [
+            Banner.objects.create(
+                title=f"Banner {index}", position="header", banner_type="text",
+                text_content="Text", created_by=self.admin,
+            )
+            for index in range(2)
+        ]
+        now = timezone.now()
+        for offset in range(40):
+            banner = self.banners[offset % 2]
+            shown = now - timedelta(days=offset, hours=offset % 5)
+            impression = BannerImpression.objects.create(banner=banner, ip_address="1.1.1.1")
+            BannerImpression.objects.filter(pk=impression.pk).update(viewed_at=shown)
+            if offset % 3 == 0:
+                click = BannerClick.objects.create(banner=banner, ip_address="1.1.1.1")
+                BannerClick.objects.filter(pk=click.pk).update(clicked_at=shown)
+
+    def test_rollup_matches_live_counts(self):
+        start = timezone.now() - timedelta(days=30)
+        live = [banner_series(banner, start) for banner in self.banners]
+        self.assertEqual(refresh_banner_daily_stats(35), 35 * len(self.banners))
+        for banner, series in zip(self.banners, live):
+            self.assertEqual(banner_series(banner, start), series)
+
+    def test_partial_rollup_falls_back_to_live_counts(self):
+        start = timezone.now() - timedelta(days=30)
+        live = banner_series(self.banners[0], start)
+        refresh_banner_daily_stats(10)
+        self.assertEqual(banner_series(self.banners[0], start), live)
+
+    def test_banner_analytics_reads_closed_days_from_rollup(self):
+        url = reverse("admin-banners-analytics", args=[self.banners[0].pk])
+        live = self.client.get(url).data
+        call_command("refresh_analytics", days=35, stdout=StringIO())
+
+        with CaptureQueriesContext(connection) as captured:
+            rolled_up = self.client.get(url).data
+        self.assertEqual(rolled_up, live)
+        self.assertTrue(
+            any("administrator_bannerdailystats" in entry["sql"] for entry in captured)
+        )
+
+
+class AdminLoginThrottleTests(AdminAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(None)
+        # Every attempt logs a warning
+        self.enterContext(mock.patch("administrator.auth_views.logger"))
+
+    def login(self, password="wrong-password", email="admin@example.com", ip="10.0.0.1"):
+        return self.client.post(
+            reverse("admin-login"),
+            {"email": email, "password": password},
+            format="json",
+            REMOTE_ADDR=ip,
+        )
+
+    def test_attempts_over_the_limit_are_throttled(self):
+        for _ in range(ADMIN_LOGIN_MAX_ATTEMPTS):
+            self.assertEqual(self.login().status_code, 401)
+
+        with mock.patch("administrator.auth_views.authenticate") as authenticate:
+            response = self.login(password="pw12345678")
+        self.assertEqual(response.status_code, 429)
+        authenticate.assert_not_called()
+
+    def test_limit_is_per_ip_and_email(self):
+        for _ in range(ADMIN_LOGIN_MAX_ATTEMPTS + 1):
+            self.login()
+        self.assertEqual(self.login(ip="10.0.0.2").status_code, 401)
+        self.assertEqual(self.login(email="user0@example.com").status_code, 401)
+
+    def test_successful_login_resets_the_count(self):
+        for _ in range(ADMIN_LOGIN_MAX_ATTEMPTS - 1):
+            self.login()
+        self.assertEqual(self.login(password="pw12345678").status_code, 200)
+        for _ in range(ADMIN_LOGIN_MAX_ATTEMPTS):
+            self.assertEqual(self.login().status_code, 401)
+
+
+class AdminProfileETagTests(AdminAPITestCase):
+    def get_profile(self, etag=None):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        return self.client.get(reverse("admin-profile"), **headers)
+
+    def test_unchanged_profile_is_not_modified(self):
+        response = self.get_profile()
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        response = self.get_profile(etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_changes_produce_a_new_etag(self):
+        etag = self.get_profile()["ETag"]
+
+        self.admin.first_name = "Renamed"
+        self.admin.save()
+        self.client.force_authenticate(User.objects.get(pk=self.admin.pk))
+        response = self.get_profile(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["first_name"], "Renamed")
+        self.assertNotEqual(response["ETag"], etag)
+        etag = response["ETag"]
+
+        # Logins save last_login alone, leaving updated_at as it was
+        self.admin.last_login = timezone.now()
+        self.admin.save(update_fields=["last_login"])
+        self.client.force_authenticate(User.objects.get(pk=self.admin.pk))
+        self.assertEqual(self.get_profile(etag).status_code, 200)
+
+    def test_requires_staff(self):
+        self.client.force_authenticate(self.users[0])
+        self.assertEqual(self.get_profile().status_code, 403)
+
+
+class AdminSettingsCacheTests(AdminAPITestCase):
+    def test_settings_are_cached_with_a_timeout(self):
+        response = self.client.get(reverse("admin-settings"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(cache.get(ADMIN_SETTINGS_CACHE_KEY), response.data)
+
+        # Other processes only see a save once their entry times out
+        later = time.time() + ADMIN_SETTINGS_TIMEOUT + 1
+        with mock.patch("django.core.cache.backends.locmem.time.time", return_value=later):
+            self.assertIsNone(cache.get(ADMIN_SETTINGS_CACHE_KEY))
+
+    def test_update_drops_cached_settings(self):
+        self.client.get(reverse("admin-settings"))
+        self.client.put(
+            reverse("admin-settings-update"), {"site_name": "Renamed"}, format="json"
+        )
+        response = self.client.get(reverse("admin-settings"))
+        self.assertEqual(response.data["site_name"], "Renamed")
+
+
+class RevenueAnalyticsTests(AdminAPITestCase):
+    def get_revenue(self):
+        response = self.client.get(reverse("admin-analytics-revenue"))
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_revenue_uses_the_configured_price(self):
+        self.create_ad(status="approved", plan="featured")
+        self.assertEqual(self.get_revenue()["total_revenue"], 9.99)
+
+        self.client.put(
+            reverse("admin-settings-update"), {"featured_ad_price": "5.00"}, format="json"
+        )
+        self.assertEqual(get_featured_ad_price(), 5.0)
+        self.assertEqual(self.get_revenue()["total_revenue"], 5.0)
+
+
+class UserExportTests(AdminAPITestCase):
+    def test_total_ads_includes_deleted_ads(self):
+        self.create_ad(status="approved")
+        self.create_ad(status="deleted")
+
+        response = self.client.get(reverse("admin-export-users"))
+        self.assertEqual(response.status_code, 200)
+        content = b"".join(response.streaming_content).decode()
+        totals = {
+            row["Email"]: row["Total Ads"] for row in csv.DictReader(StringIO(content))
+        }
+        self.assertEqual(totals[self.users[0].email], "2")
+        self.assertEqual(totals[self.users[1].email], "0")
+
+
+class ReportAdImageTests(AdminAPITestCase):
+    def test_stored_paths_and_absolute_urls(self):
+        images = {
+            "ads/photo.jpg": "/media/ads/photo.jpg",
+            "https://cdn.example.com/photo.jpg": "https://cdn.example.com/photo.jpg",
+        }
+        expected = {}
+        for stored, url in images.items():
+            ad = self.create_ad(status="approved")
+            # bulk_create skips AdImage.save(), which reads the file size
+            AdImage.objects.bulk_create([AdImage(ad=ad, image=stored)])
+            AdReport.objects.create(
+                ad=ad, reported_by=self.users[1], reason="spam", description="Report"
+            )
+            expected[ad.id] = url
+
+        response = self.client.get(reverse("admin-reports-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {row["ad"]["id"]: row["ad"]["image"] for row in response.data["results"]},
+            expected,
+        )
@@ -121,8 +121,13 @@ Filters: ?is_active=true&placement=homepage&state=IL
 Sort: ?ordering=-created_at
 
 All endpoints use proper pagination from core.pagination:
-- LargeResultsSetPagination (50 per page) for ads, users, reports
-- StandardResultsSetPagination (20 per page) for banners
+- LargeResultsSetKeysetPagination (50 per page) for ads, users, reports;
+  add ?cursor= for keyset pages without a total count
+- StandardResultsSetKeysetPagination (20 per page) for banners; also
+  accepts ?cursor=
+
+Users and reports are served only by their ViewSets; there are no
+function-based list/action views for them.
 
 All endpoints support:
 - DjangoFilterBackend for filtering
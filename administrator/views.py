@@ -3,31 +3,127 @@ from rest_framework import generics, status, viewsets, filters, serializers
 from rest_framework.decorators import api_view, permission_classes, action as drf_action
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
-from django.db.models import Count, Sum, Q, Avg, F
-from django.db.models.functions import TruncDate, TruncMonth, TruncDay
+from django.db.models import (
+    Count, Sum, Q, Avg, F, OuterRef, Subquery, IntegerField, FloatField,
+    BooleanField, ExpressionWrapper, Case, When, Value, CharField,
+)
+from django.db.models.functions import (
+    TruncDate, TruncMonth, TruncDay, Coalesce, Cast, NullIf, Now,
+)
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta, datetime
+from collections import defaultdict
+from functools import wraps
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 
 from core.simple_mixins import AdminViewMixin
 from core.search_mixins import SearchFilterMixin
-from core.pagination import LargeResultsSetPagination, StandardResultsSetPagination
+from core.pagination import (
+    LargeResultsSetKeysetPagination,
+    StandardResultsSetKeysetPagination,
+)
+from core.utils import aggregate_many, chunked, streaming_csv_response
 
+from ads.counters import ad_counter_changes
 from ads.models import Ad, AdView, AdContact, AdFavorite, AdReport
 from accounts.models import User
 from content.models import Category, State, City
-from .models import Banner, AdminSettings
+from content.serializers import CitySerializer
+from .analytics import activity_series, banner_series, daily_counts, start_of_day
+from .models import (
+    AdminSettings,
+    Banner,
+    CategorySummary,
+)
 from .serializers import (
     AdminAdSerializer,
+    AdminAdListSerializer,
     AdminAdActionSerializer,
     AdminUserSerializer,
     AdminStateSerializer,
     AdminCategorySerializer,
     AdminReportSerializer,
     AdminBannerSerializer,
+    BulkAdActionSerializer,
+    BulkUserActionSerializer,
+    full_name_expression,
 )
 from .filters import AdminUserFilter, AdminReportFilter, AdminAdFilter
+from .cache_utils import (
+    ADMIN_ANALYTICS_TIMEOUT,
+    ADMIN_CATALOG_TIMEOUT,
+    ADMIN_DASHBOARD_TIMEOUT,
+    ADMIN_SETTINGS_DEFAULTS,
+    admin_stats_key,
+    get_admin_settings,
+    get_featured_ad_price,
+    invalidate_admin_ad_rows,
+    invalidate_admin_stats,
+    invalidate_admin_user_states,
+)
+
+
+def ads_count_subquery(relation, ads_qs, count=None):
+    """
+    Correlated subquery counting rows of ``ads_qs`` that point at the outer row.
+
+    ``relation`` is the Ad field referencing the outer model (e.g. ``"user"``).
+    Using one subquery per count instead of several ``Count('ads', ...)``
+    annotations keeps the outer query free of joins that multiply rows.
+    """
+    return Coalesce(
+        Subquery(
+            ads_qs.filter(**{relation: OuterRef("pk")})
+            .order_by()
+            .values(relation)
+            .annotate(total=count or Count("*"))
+            .values("total"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def with_state_ad_stats(queryset):
+    """
+    Annotate states with the distinct-user count shown in the admin state list.
+
+    Ad counts are read from the denormalized ``*_ads_cache`` columns.
+    """
+    return queryset.annotate(
+        users_count=ads_count_subquery(
+            "state", Ad.objects.all(), count=Count("user", distinct=True)
+        ),
+    )
+
+
+def with_user_status_display(queryset):
+    """Annotate users with the admin status label (banned/suspended/active)."""
+    return queryset.annotate(
+        status_display=Case(
+            When(is_active=False, then=Value("banned")),
+            When(is_suspended=True, then=Value("suspended")),
+            default=Value("active"),
+            output_field=CharField(),
+        )
+    )
+
+
+def with_banner_stats(queryset):
+    """Annotate banners with CTR and current-activity flags computed in SQL."""
+    return queryset.annotate(
+        # NULL when there are no impressions; the serializer reports that as 0
+        ctr_value=Cast("clicks", FloatField()) / NullIf("impressions", 0) * 100,
+        currently_active=ExpressionWrapper(
+            Q(is_active=True, start_date__lte=Now())
+            & (Q(end_date__isnull=True) | Q(end_date__gte=Now())),
+            output_field=BooleanField(),
+        ),
+    )
+
 
 # ============================================================================
 # DASHBOARD STATISTICS
@@ -42,79 +138,96 @@ class AdminDashboardStatsView(generics.GenericAPIView):
     def get(self, request):
         state_filter = request.query_params.get("state", "all")
 
+        # Stats need not be real-time; admin actions drop the cache early
+        data = cache.get_or_set(
+            admin_stats_key("dashboard", state_filter),
+            lambda: self.get_stats(state_filter),
+            ADMIN_DASHBOARD_TIMEOUT,
+        )
+        return Response(data)
+
+    def get_stats(self, state_filter):
+        """Compute the dashboard figures for ``state_filter``."""
         # Base queryset
-        ads_qs = Ad.objects.exclude(status="deleted")
+        ads_qs = Ad.non_deleted.all()
         users_qs = User.objects.all()
+        states_qs = State.objects.all()
 
         # Apply state filter
         if state_filter != "all":
             ads_qs = ads_qs.filter(state__code=state_filter)
-
-        # Calculate statistics
-        total_ads = ads_qs.count()
-        active_ads = ads_qs.filter(status="approved").count()
-        pending_ads = ads_qs.filter(status="pending").count()
-        rejected_ads = ads_qs.filter(status="rejected").count()
-        featured_ads = ads_qs.filter(plan="featured").count()
-
-        total_users = users_qs.count()
-        active_users = users_qs.filter(is_active=True, is_suspended=False).count()
-        suspended_users = users_qs.filter(is_suspended=True).count()
-        banned_users = users_qs.filter(is_active=False).count()
-
-        total_views = AdView.objects.filter(ad__in=ads_qs).count()
-        total_contacts = AdContact.objects.filter(ad__in=ads_qs).count()
-        total_favorites = AdFavorite.objects.filter(ad__in=ads_qs).count()
-
-        pending_reports = AdReport.objects.filter(
-            is_reviewed=False, ad__in=ads_qs
-        ).count()
+            states_qs = states_qs.filter(code=state_filter)
 
         # Recent activity (last 7 days)
         week_ago = timezone.now() - timedelta(days=7)
-        new_ads_this_week = ads_qs.filter(created_at__gte=week_ago).count()
-        new_users_this_week = users_qs.filter(created_at__gte=week_ago).count()
 
-        return Response(
-            {
-                "ads": {
-                    "total": total_ads,
-                    "active": active_ads,
-                    "pending": pending_ads,
-                    "rejected": rejected_ads,
-                    "featured": featured_ads,
-                    "new_this_week": new_ads_this_week,
-                },
-                "users": {
-                    "total": total_users,
-                    "active": active_users,
-                    "suspended": suspended_users,
-                    "banned": banned_users,
-                    "new_this_week": new_users_this_week,
-                },
-                "engagement": {
-                    "total_views": total_views,
-                    "total_contacts": total_contacts,
-                    "total_favorites": total_favorites,
+        # All figures in one round trip. Ad status figures are summed from
+        # the denormalized per-state counters instead of scanning the ads
+        # table; only the time-based count still reads ads.
+        stats = aggregate_many(
+            ads=(
+                states_qs,
+                {
+                    "total": Coalesce(Sum("total_ads_cache"), 0),
+                    "active": Coalesce(Sum("active_ads_cache"), 0),
+                    "pending": Coalesce(Sum("pending_ads_cache"), 0),
+                    "rejected": Coalesce(Sum("rejected_ads_cache"), 0),
+                    "featured": Coalesce(Sum("live_featured_ads_cache"), 0),
                 },
-                "moderation": {
-                    "pending_reports": pending_reports,
+            ),
+            new_ads=(
+                ads_qs.filter(created_at__gte=week_ago),
+                {"new_this_week": Count("id")},
+            ),
+            users=(
+                users_qs,
+                {
+                    "total": Count("id"),
+                    "active": Count("id", filter=Q(is_active=True, is_suspended=False)),
+                    "suspended": Count("id", filter=Q(is_suspended=True)),
+                    "banned": Count("id", filter=Q(is_active=False)),
+                    "new_this_week": Count("id", filter=Q(created_at__gte=week_ago)),
                 },
-            }
+            ),
+            views=(AdView.objects.filter(ad__in=ads_qs), {"total": Count("id")}),
+            contacts=(AdContact.objects.filter(ad__in=ads_qs), {"total": Count("id")}),
+            favorites=(AdFavorite.objects.filter(ad__in=ads_qs), {"total": Count("id")}),
+            reports=(
+                AdReport.objects.filter(is_reviewed=False, ad__in=ads_qs),
+                {"pending": Count("id")},
+            ),
         )
 
+        return {
+            "ads": {**stats["ads"], **stats["new_ads"]},
+            "users": stats["users"],
+            "engagement": {
+                "total_views": stats["views"]["total"],
+                "total_contacts": stats["contacts"]["total"],
+                "total_favorites": stats["favorites"]["total"],
+            },
+            "moderation": {
+                "pending_reports": stats["reports"]["pending"],
+            },
+        }
+
 
 # ============================================================================
 # ADS MANAGEMENT
 # ============================================================================
 
 
+# Ids per UPDATE in bulk actions, keeping each IN list well under the
+# database's bind parameter limit
+BULK_ACTION_BATCH_SIZE = 10000
+
+
 class AdminAdViewSet(AdminViewMixin, SearchFilterMixin, viewsets.ReadOnlyModelViewSet):
     """Admin ViewSet for managing ads with filtering and search."""
 
     serializer_class = AdminAdSerializer
     permission_classes = [IsAdminUser]
-    pagination_class = LargeResultsSetPagination
+    pagination_class = LargeResultsSetKeysetPagination
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
@@ -137,100 +250,139 @@ class AdminAdViewSet(AdminViewMixin, SearchFilterMixin, viewsets.ReadOnlyModelVi
 
     state_field_path = "state__code"
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return AdminAdListSerializer
+        return AdminAdSerializer
+
     def get_queryset(self):
         """Get ads queryset with admin filtering."""
-        return Ad.objects.select_related(
-            "category", "city", "state", "user"
-        ).prefetch_related("images")
+        if self.action == "list":
+            return Ad.objects.all()
+        queryset = AdminAdSerializer.prefetch_queryset(Ad.objects.all())
+        if self.action == "action":
+            # Moderation locks the ad row, not its joined relations
+            queryset = queryset.select_for_update(of=("self",))
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """List ads; the page is resolved to ids and rows come from the row cache."""
+        # The ordering columns ride along so keyset pages can build their cursor
+        keys = self.filter_queryset(self.get_queryset()).values(
+            "id", *self.ordering_fields
+        )
+
+        page = self.paginate_queryset(keys)
+        rows = AdminAdListSerializer.load_rows(
+            [row["id"] for row in (page if page is not None else keys)]
+        )
+        serializer = self.get_serializer(rows, many=True)
+
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
+
+    action_past_tense = {
+        "approve": "approved",
+        "reject": "rejected",
+        "delete": "deleted",
+        "feature": "featured",
+        "unfeature": "unfeatured",
+    }
+
+    def get_action_changes(self, action, reason, admin_notes):
+        """Field values a moderation ``action`` writes, or None if unknown."""
+        now = timezone.now()
+        if action == "approve":
+            return {
+                "status": "approved",
+                "approved_by": self.request.user,
+                "approved_at": now,
+            }
+        if action == "reject":
+            return {
+                "status": "rejected",
+                "rejection_reason": reason or "Rejected by admin",
+                "admin_notes": admin_notes,
+            }
+        if action == "delete":
+            return {"status": "deleted", "admin_notes": admin_notes}
+        if action == "feature":
+            return {
+                "plan": "featured",
+                "featured_expires_at": now + timedelta(days=30),
+            }
+        if action == "unfeature":
+            return {"plan": "free", "featured_expires_at": None}
+        return None
 
     @drf_action(detail=True, methods=["post"])
     def action(self, request, pk=None):
         """Approve, reject, delete, feature, or unfeature ads."""
-        ad = self.get_object()
         action = request.data.get("action")
         reason = request.data.get("reason", "")
         admin_notes = request.data.get("admin_notes", "")
 
-        if action == "approve":
-            ad.status = "approved"
-            ad.approved_by = request.user
-            ad.approved_at = timezone.now()
-            message = "Ad approved successfully"
-
-        elif action == "reject":
-            ad.status = "rejected"
-            ad.rejection_reason = reason or "Rejected by admin"
-            ad.admin_notes = admin_notes
-            message = "Ad rejected successfully"
-
-        elif action == "delete":
-            ad.status = "deleted"
-            ad.admin_notes = admin_notes
-            message = "Ad deleted successfully"
-
-        elif action == "feature":
-            ad.plan = "featured"
-            ad.featured_expires_at = timezone.now() + timedelta(days=30)
-            message = "Ad featured successfully"
-
-        elif action == "unfeature":
-            ad.plan = "free"
-            ad.featured_expires_at = None
-            message = "Ad unfeatured successfully"
+        changes = self.get_action_changes(action, reason, admin_notes)
 
-        else:
-            return Response({"error": "Invalid action"}, status=400)
+        # The row stays locked from read to write, so concurrent moderation
+        # of the same ad is applied one action at a time
+        with transaction.atomic():
+            ad = self.get_object()
+            if changes is None:
+                return Response({"error": "Invalid action"}, status=400)
+
+            for field, value in changes.items():
+                setattr(ad, field, value)
+            # Write only the moderated columns rather than the whole row
+            ad.save(update_fields=[*changes, "updated_at"])
 
-        ad.save()
+        # The save signals ran before commit; drop the caches again. A reader
+        # that loaded the old row before the commit can still cache it, for at
+        # most ADMIN_AD_ROW_TIMEOUT
+        invalidate_admin_ad_rows([ad.pk])
+        invalidate_admin_stats()
 
+        message = f"Ad {self.action_past_tense[action]} successfully"
         return Response({"message": message, "ad": AdminAdSerializer(ad).data})
 
     @drf_action(detail=False, methods=["post"])
     def bulk_action(self, request):
         """Perform bulk actions on multiple ads."""
-        ad_ids = request.data.get("ad_ids", [])
-        action = request.data.get("action")
-        reason = request.data.get("reason", "")
-        admin_notes = request.data.get("admin_notes", "")
-
-        if not ad_ids or action not in [
-            "approve",
-            "reject",
-            "delete",
-            "feature",
-            "unfeature",
-        ]:
-            return Response({"error": "Invalid data provided"}, status=400)
+        serializer = BulkAdActionSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": "Invalid data provided", "details": serializer.errors},
+                status=400,
+            )
+        ad_ids = serializer.validated_data["ad_ids"]
+        changes = self.get_action_changes(
+            serializer.validated_data["action"],
+            serializer.validated_data.get("reason", ""),
+            serializer.validated_data.get("admin_notes", ""),
+        )
 
-        ads = Ad.objects.filter(id__in=ad_ids)
+        # One UPDATE per slice of ids; update() skips save() and signals, so
+        # apply the counter changes the Ad signals would have applied. All
+        # slices and their counter changes commit together.
+        batches = [
+            Ad.objects.filter(id__in=batch)
+            for batch in chunked(ad_ids, BULK_ACTION_BATCH_SIZE)
+        ]
+        now = timezone.now()
+        with transaction.atomic(), ad_counter_changes(*batches):
+            updated_count = sum(
+                ads.update(updated_at=now, **changes) for ads in batches
+            )
 
-        if not ads.exists():
+        if not updated_count:
             return Response({"error": "No ads found with provided IDs"}, status=404)
 
-        updated_count = 0
-
-        for ad in ads:
-            if action == "approve":
-                ad.status = "approved"
-                ad.approved_by = request.user
-                ad.approved_at = timezone.now()
-            elif action == "reject":
-                ad.status = "rejected"
-                ad.rejection_reason = reason or "Rejected by admin"
-                ad.admin_notes = admin_notes
-            elif action == "delete":
-                ad.status = "deleted"
-                ad.admin_notes = admin_notes
-            elif action == "feature":
-                ad.plan = "featured"
-                ad.featured_expires_at = timezone.now() + timedelta(days=30)
-            elif action == "unfeature":
-                ad.plan = "free"
-                ad.featured_expires_at = None
-
-            ad.save()
-            updated_count += 1
-
+        # Drop the caches after commit. A reader that loaded a row before the
+        # commit can still cache it afterwards; ADMIN_AD_ROW_TIMEOUT bounds how
+        # long that stale row is served
+        invalidate_admin_ad_rows(ad_ids)
+        invalidate_admin_stats()
         return Response(
             {
                 "message": f"{updated_count} ads updated successfully",
@@ -251,20 +403,13 @@ class AdminUserViewSet(
 
     serializer_class = AdminUserSerializer
     permission_classes = [IsAdminUser]
-    pagination_class = LargeResultsSetPagination
+    pagination_class = LargeResultsSetKeysetPagination
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
     filterset_class = AdminUserFilter
-    filter_backends = [
-        DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter,
-    ]
-
-    filterset_class = AdminUserFilter  # Local filter
 
     search_fields = [
         "email",
@@ -273,14 +418,26 @@ class AdminUserViewSet(
         "phone",
     ]
 
-    ordering_fields = ["created_at", "email", "first_name", "last_name"]
+    ordering_fields = ["created_at", "email", "first_name", "last_name", "status_display"]
     ordering = ["-created_at"]
 
     def get_queryset(self):
-        return User.objects.filter(
+        queryset = User.objects.filter(
             is_superuser=False,
             is_staff=False
-        ).select_related().prefetch_related("ads")
+        ).annotate(full_name_value=full_name_expression())
+        if self.action == "list":
+            queryset = with_user_status_display(
+                AdminUserSerializer.prefetch_queryset(queryset)
+            )
+        elif self.action == "activity":
+            # Rejected ads have no counter column; count them with the user row
+            queryset = queryset.annotate(
+                rejected_ads_count=ads_count_subquery(
+                    "user", Ad.objects.filter(status="rejected")
+                )
+            )
+        return queryset
 
     @drf_action(detail=True, methods=["post"])
     def action(self, request, pk=None):
@@ -310,6 +467,7 @@ class AdminUserViewSet(
             return Response({"error": "Invalid action"}, status=400)
 
         user.save()
+        invalidate_admin_stats()
 
         return Response(
             {
@@ -329,16 +487,20 @@ class AdminUserViewSet(
 
         # Get user's ads activity
         ads_data = {
-            "total_ads": user.ads.exclude(status="deleted").count(),
-            "active_ads": user.ads.filter(status="approved").count(),
-            "pending_ads": user.ads.filter(status="pending").count(),
-            "rejected_ads": user.ads.filter(status="rejected").count(),
-            "featured_ads": user.ads.filter(plan="featured").count(),
+            "total_ads": user.total_ads_cache,
+            "active_ads": user.active_ads_cache,
+            "pending_ads": user.pending_ads_cache,
+            "rejected_ads": user.rejected_ads_count,
+            "featured_ads": user.featured_ads_cache,
         }
 
-        # Get recent ads
-        recent_ads = user.ads.exclude(status="deleted").order_by("-created_at")[:10]
-        recent_ads_data = AdminAdSerializer(recent_ads, many=True).data
+        # Get recent ads; rows come from the admin ad row cache like the ad list
+        recent_ad_ids = user.ads(manager="non_deleted").order_by(
+            "-created_at"
+        ).values_list("id", flat=True)[:10]
+        recent_ads_data = AdminAdListSerializer(
+            AdminAdListSerializer.load_rows(recent_ad_ids), many=True
+        ).data
 
         return Response(
             {
@@ -351,36 +513,41 @@ class AdminUserViewSet(
     @drf_action(detail=False, methods=["post"])
     def bulk_action(self, request):
         """Perform bulk actions on multiple users."""
-        user_ids = request.data.get("user_ids", [])
-        action = request.data.get("action")
-        reason = request.data.get("reason", "")
+        serializer = BulkUserActionSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": "Invalid data provided", "details": serializer.errors},
+                status=400,
+            )
+        user_ids = serializer.validated_data["user_ids"]
+        action = serializer.validated_data["action"]
+        reason = serializer.validated_data.get("reason", "")
 
-        if not user_ids or action not in ["ban", "suspend", "activate"]:
-            return Response({"error": "Invalid data provided"}, status=400)
+        if action == "ban":
+            changes = {
+                "is_active": False,
+                "is_suspended": True,
+                "suspension_reason": reason,
+            }
+        elif action == "suspend":
+            changes = {"is_suspended": True, "suspension_reason": reason}
+        else:
+            changes = {
+                "is_active": True,
+                "is_suspended": False,
+                "suspension_reason": "",
+            }
 
-        users = User.objects.filter(id__in=user_ids)
+        updated_count = User.objects.filter(id__in=user_ids).update(
+            updated_at=timezone.now(), **changes
+        )
 
-        if not users.exists():
+        if not updated_count:
             return Response({"error": "No users found with provided IDs"}, status=404)
 
-        updated_count = 0
-
-        for user in users:
-            if action == "ban":
-                user.is_active = False
-                user.is_suspended = True
-                user.suspension_reason = reason
-            elif action == "suspend":
-                user.is_suspended = True
-                user.suspension_reason = reason
-            elif action == "activate":
-                user.is_active = True
-                user.is_suspended = False
-                user.suspension_reason = ""
-
-            user.save()
-            updated_count += 1
-
+        # update() bypasses the post_save receiver that drops cached user flags
+        invalidate_admin_user_states(user_ids)
+        invalidate_admin_stats()
         return Response(
             {
                 "message": f"Successfully {action}ed {updated_count} users",
@@ -399,7 +566,7 @@ class AdminReportViewSet(AdminViewMixin, viewsets.ReadOnlyModelViewSet):
 
     serializer_class = AdminReportSerializer
     permission_classes = [IsAdminUser]
-    pagination_class = LargeResultsSetPagination
+    pagination_class = LargeResultsSetKeysetPagination
     filter_backends = [
         DjangoFilterBackend,
         filters.OrderingFilter,
@@ -412,7 +579,11 @@ class AdminReportViewSet(AdminViewMixin, viewsets.ReadOnlyModelViewSet):
 
     def get_queryset(self):
         """Get reports queryset with filtering."""
-        return AdReport.objects.select_related("ad", "reported_by", "reviewed_by")
+        queryset = AdReport.objects.all()
+        if self.action in ("list", "retrieve"):
+            return AdminReportSerializer.prefetch_queryset(queryset)
+        # Moderation actions save the reported ad along with the report
+        return queryset.select_related("ad")
 
     @drf_action(detail=True, methods=["post"])
     def action(self, request, pk=None):
@@ -420,6 +591,7 @@ class AdminReportViewSet(AdminViewMixin, viewsets.ReadOnlyModelViewSet):
         report = self.get_object()
         action = request.data.get("action")
         admin_notes = request.data.get("admin_notes", "")
+        ad_changes = {}
 
         if action == "approve":
             # Mark report as reviewed and take action on the ad
@@ -429,14 +601,13 @@ class AdminReportViewSet(AdminViewMixin, viewsets.ReadOnlyModelViewSet):
             report.admin_notes = admin_notes
 
             # Take action on the reported ad based on the report reason
-            ad = report.ad
             if report.reason in ["spam", "fraud"]:
-                ad.status = "rejected"
-                ad.rejection_reason = f"Reported as {report.get_reason_display()}"
+                ad_changes = {
+                    "status": "rejected",
+                    "rejection_reason": f"Reported as {report.get_reason_display()}",
+                }
             elif report.reason == "inappropriate":
-                ad.status = "pending"  # Send back for review
-
-            ad.save()
+                ad_changes = {"status": "pending"}  # Send back for review
             message = "Report approved and action taken on ad"
 
         elif action == "dismiss":
@@ -449,7 +620,22 @@ class AdminReportViewSet(AdminViewMixin, viewsets.ReadOnlyModelViewSet):
         else:
             return Response({"error": "Invalid action"}, status=400)
 
-        report.save()
+        # Each save writes only the columns the review changed
+        review_fields = ["is_reviewed", "reviewed_by", "reviewed_at", "admin_notes"]
+        if ad_changes:
+            # The report and the ad it moderates commit together
+            with transaction.atomic():
+                ad = report.ad
+                for field, value in ad_changes.items():
+                    setattr(ad, field, value)
+                ad.save(update_fields=[*ad_changes, "updated_at"])
+                report.save(update_fields=review_fields)
+
+            # The ad's save signals ran before commit; drop its row again
+            invalidate_admin_ad_rows([report.ad_id])
+        else:
+            report.save(update_fields=review_fields)
+        invalidate_admin_stats()
 
         return Response({"message": message, "report_status": "reviewed"})
 
@@ -464,30 +650,59 @@ class AdminReportViewSet(AdminViewMixin, viewsets.ReadOnlyModelViewSet):
             return Response({"error": "Invalid data provided"}, status=400)
 
         reports = AdReport.objects.filter(id__in=report_ids)
+        moderated_ids = set()
 
-        if not reports.exists():
-            return Response({"error": "No reports found with provided IDs"}, status=404)
-
-        updated_count = 0
-
-        for report in reports:
-            report.is_reviewed = True
-            report.reviewed_by = request.user
-            report.reviewed_at = timezone.now()
-            report.admin_notes = admin_notes
-
+        # The reports, the ads they moderate and the ad counters commit together
+        with transaction.atomic():
             if action == "approve":
-                ad = report.ad
-                if report.reason in ["spam", "fraud"]:
-                    ad.status = "rejected"
-                    ad.rejection_reason = f"Reported as {report.get_reason_display()}"
-                elif report.reason == "inappropriate":
-                    ad.status = "pending"
-                ad.save()
+                ad_ids_by_reason = defaultdict(set)
+                for ad_id, reason in reports.values_list("ad_id", "reason"):
+                    ad_ids_by_reason[reason].add(ad_id)
+
+                moderated_ids = (
+                    ad_ids_by_reason["inappropriate"]
+                    | ad_ids_by_reason["spam"]
+                    | ad_ids_by_reason["fraud"]
+                )
+
+                # One UPDATE per outcome; rejections go last so they win when
+                # an ad was reported for several reasons
+                now = timezone.now()
+                reason_labels = AdReport.REASON_LABELS
+                with ad_counter_changes(Ad.objects.filter(id__in=moderated_ids)):
+                    Ad.objects.filter(
+                        id__in=ad_ids_by_reason["inappropriate"]
+                    ).update(status="pending", updated_at=now)
+                    Ad.objects.filter(
+                        id__in=ad_ids_by_reason["spam"] | ad_ids_by_reason["fraud"]
+                    ).update(
+                        status="rejected",
+                        # Fraud takes precedence over spam
+                        rejection_reason=Case(
+                            When(
+                                id__in=ad_ids_by_reason["fraud"],
+                                then=Value(f"Reported as {reason_labels['fraud']}"),
+                            ),
+                            default=Value(f"Reported as {reason_labels['spam']}"),
+                        ),
+                        updated_at=now,
+                    )
+
+            updated_count = reports.update(
+                is_reviewed=True,
+                reviewed_by=request.user,
+                reviewed_at=timezone.now(),
+                admin_notes=admin_notes,
+            )
 
-            report.save()
-            updated_count += 1
+        if not updated_count:
+            return Response({"error": "No reports found with provided IDs"}, status=404)
 
+        # Drop the caches after commit. A reader that loaded a row before the
+        # commit can still cache it afterwards; ADMIN_AD_ROW_TIMEOUT bounds how
+        # long that stale row is served
+        invalidate_admin_ad_rows(moderated_ids)
+        invalidate_admin_stats()
         return Response(
             {
                 "message": f"{updated_count} reports processed successfully",
@@ -501,73 +716,109 @@ class AdminReportViewSet(AdminViewMixin, viewsets.ReadOnlyModelViewSet):
 # ============================================================================
 
 
+# Longest analytics window a request can ask for, in days
+ANALYTICS_MAX_DAYS = 3650
+
+analytics_days_field = serializers.IntegerField(min_value=1, max_value=ANALYTICS_MAX_DAYS)
+
+
+def analytics_days(request):
+    """The ``days`` query parameter of an analytics request, 30 by default."""
+    try:
+        return analytics_days_field.run_validation(request.query_params.get("days", 30))
+    except serializers.ValidationError as exc:
+        raise serializers.ValidationError({"days": exc.detail})
+
+
+def cached_analytics(*params):
+    """
+    Cache the response data of an analytics view per value of the query
+    ``params`` it reads.
+
+    Dashboards poll these endpoints with the same parameters, so repeated
+    polls within ADMIN_ANALYTICS_TIMEOUT skip the aggregation queries. Ad,
+    user and catalog changes retire the entries early through the shared
+    admin stats generation. The key uses the raw parameter strings; the
+    view validates them, and errors are raised rather than cached.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            key = admin_stats_key(
+                f"analytics:{view.__name__}",
+                *(request.query_params.get(param, "") for param in params),
+            )
+            data = cache.get_or_set(
+                key,
+                lambda: view(request, *args, **kwargs).data,
+                ADMIN_ANALYTICS_TIMEOUT,
+            )
+            return Response(data)
+
+        return wrapper
+
+    return decorator
+
+
 @api_view(["GET"])
 @permission_classes([IsAdminUser])
+@cached_analytics("days", "state")
 def admin_analytics_overview(request):
     """Get comprehensive analytics overview."""
     state_filter = request.query_params.get("state", "all")
-    days = int(request.query_params.get("days", 30))
+    days = analytics_days(request)
 
     end_date = timezone.now()
     start_date = end_date - timedelta(days=days)
 
     # Base queryset
-    ads_qs = Ad.objects.exclude(status="deleted")
+    ads_qs = Ad.non_deleted.all()
     if state_filter != "all":
         ads_qs = ads_qs.filter(state__code=state_filter)
 
-    # Daily ad creation trend
-    daily_ads = (
-        ads_qs.filter(created_at__gte=start_date)
-        .annotate(date=TruncDate("created_at"))
-        .values("date")
-        .annotate(count=Count("id"))
-        .order_by("date")
-    )
-
-    # Status distribution
-    status_dist = ads_qs.values("status").annotate(count=Count("id"))
-
-    # Category distribution
-    category_dist = (
-        ads_qs.values("category__name")
-        .annotate(count=Count("id"))
-        .order_by("-count")[:10]
-    )
+    # Daily ad, view and contact trends, closed days read from the rollup
+    daily = activity_series(start_date, state_filter)
 
-    # View and contact trends
-    daily_views = (
-        AdView.objects.filter(viewed_at__gte=start_date, ad__in=ads_qs)
-        .annotate(date=TruncDate("viewed_at"))
-        .values("date")
+    # Status and category distributions from one grouped scan of the ads
+    status_counts = defaultdict(int)
+    category_counts = defaultdict(int)
+    for status_name, category_name, count in (
+        ads_qs.values_list("status", "category__name")
         .annotate(count=Count("id"))
-        .order_by("date")
-    )
-
-    daily_contacts = (
-        AdContact.objects.filter(contacted_at__gte=start_date, ad__in=ads_qs)
-        .annotate(date=TruncDate("contacted_at"))
-        .values("date")
-        .annotate(count=Count("id"))
-        .order_by("date")
-    )
+        .order_by("status", "category__name")
+    ):
+        status_counts[status_name] += count
+        category_counts[category_name] += count
+
+    status_dist = [
+        {"status": status_name, "count": count}
+        for status_name, count in status_counts.items()
+    ]
+    category_dist = [
+        {"category__name": category_name, "count": count}
+        for category_name, count in sorted(
+            category_counts.items(), key=lambda item: -item[1]
+        )[:10]
+    ]
 
     return Response(
         {
-            "daily_ads": list(daily_ads),
-            "status_distribution": list(status_dist),
-            "top_categories": list(category_dist),
-            "daily_views": list(daily_views),
-            "daily_contacts": list(daily_contacts),
+            "daily_ads": daily["ads"],
+            "status_distribution": status_dist,
+            "top_categories": category_dist,
+            "daily_views": daily["views"],
+            "daily_contacts": daily["contacts"],
         }
     )
 
 
 @api_view(["GET"])
 @permission_classes([IsAdminUser])
+@cached_analytics("days")
 def admin_analytics_users(request):
     """Get user growth analytics."""
-    days = int(request.query_params.get("days", 30))
+    days = analytics_days(request)
 
     end_date = timezone.now()
     start_date = end_date - timedelta(days=days)
@@ -582,119 +833,134 @@ def admin_analytics_users(request):
     )
 
     # User status distribution
-    status_dist = {
-        "active": User.objects.filter(is_active=True, is_suspended=False).count(),
-        "suspended": User.objects.filter(is_suspended=True).count(),
-        "banned": User.objects.filter(is_active=False).count(),
-    }
-
-    # Top users by ad count
-    top_users = User.objects.annotate(
-        ad_count=Count("ads", filter=Q(ads__status="approved"))
-    ).order_by("-ad_count")[:10]
+    status_dist = User.objects.aggregate(
+        active=Count("id", filter=Q(is_active=True, is_suspended=False)),
+        suspended=Count("id", filter=Q(is_suspended=True)),
+        banned=Count("id", filter=Q(is_active=False)),
+    )
 
-    top_users_data = [
-        {
-            "id": user.id,
-            "email": user.email,
-            "name": user.get_full_name(),
-            "ad_count": user.ad_count,
-        }
-        for user in top_users
-    ]
+    # Top users by approved ad count, kept on the user rows
+    top_users = (
+        User.objects.order_by("-active_ads_cache")
+        .annotate(name=full_name_expression(), ad_count=F("active_ads_cache"))
+        .values("id", "email", "name", "ad_count")[:10]
+    )
 
     return Response(
         {
             "daily_registrations": list(daily_users),
             "status_distribution": status_dist,
-            "top_users": top_users_data,
+            "top_users": list(top_users),
         }
     )
 
 
 @api_view(["GET"])
 @permission_classes([IsAdminUser])
+@cached_analytics("days")
 def admin_analytics_revenue(request):
     """Get revenue analytics."""
-    days = int(request.query_params.get("days", 30))
+    days = analytics_days(request)
 
     end_date = timezone.now()
     start_date = end_date - timedelta(days=days)
 
-    # Featured ads revenue (assuming $9.99 per featured ad)
+    # Featured ads revenue at the configured featured ad price
+    featured_price = get_featured_ad_price()
+
     featured_ads = Ad.objects.filter(
         plan="featured", featured_expires_at__gte=start_date
     )
 
-    daily_revenue = (
+    daily_revenue = list(
         featured_ads.annotate(date=TruncDate("created_at"))
         .values("date")
-        .annotate(count=Count("id"), revenue=Count("id") * 9.99)
+        .annotate(count=Count("id"))
         .order_by("date")
     )
+    for day in daily_revenue:
+        day["revenue"] = day["count"] * featured_price
 
-    total_revenue = featured_ads.count() * 9.99
+    # Every featured ad falls in exactly one day, so the totals follow from
+    # the grouped rows without counting the ads again
+    featured_ads_count = sum(day["count"] for day in daily_revenue)
+    total_revenue = featured_ads_count * featured_price
 
     return Response(
         {
-            "daily_revenue": list(daily_revenue),
+            "daily_revenue": daily_revenue,
             "total_revenue": total_revenue,
-            "featured_ads_count": featured_ads.count(),
+            "featured_ads_count": featured_ads_count,
         }
     )
 
 
 @api_view(["GET"])
 @permission_classes([IsAdminUser])
+@cached_analytics()
 def admin_analytics_geographic(request):
     """Get geographic distribution analytics."""
 
-    # State-wise distribution
-    state_dist = (
-        Ad.objects.exclude(status="deleted")
-        .values("state__code", "state__name")
-        .annotate(count=Count("id"))
-        .order_by("-count")
-    )
+    # Non-deleted ad counts are kept on the state and city rows, so neither
+    # distribution has to group the ads table
+    state_dist = [
+        {"state__code": code, "state__name": name, "count": count}
+        for code, name, count in State.objects.filter(total_ads_cache__gt=0)
+        .order_by("-total_ads_cache")
+        .values_list("code", "name", "total_ads_cache")
+    ]
 
     # City-wise distribution (top 20)
-    city_dist = (
-        Ad.objects.exclude(status="deleted")
-        .values("city__name", "state__code")
-        .annotate(count=Count("id"))
-        .order_by("-count")[:20]
-    )
+    city_dist = [
+        {"city__name": name, "state__code": state_code, "count": count}
+        for name, state_code, count in City.objects.filter(total_ads_cache__gt=0)
+        .order_by("-total_ads_cache")
+        .values_list("name", "state__code", "total_ads_cache")[:20]
+    ]
 
     return Response(
         {
-            "state_distribution": list(state_dist),
-            "top_cities": list(city_dist),
+            "state_distribution": state_dist,
+            "top_cities": city_dist,
         }
     )
 
 
 @api_view(["GET"])
 @permission_classes([IsAdminUser])
+@cached_analytics()
 def admin_analytics_categories(request):
     """Get category performance analytics."""
 
-    # Category performance
-    categories = Category.objects.annotate(
-        total_ads=Count("ads", filter=Q(ads__status="approved")),
-        total_views=Sum("ads__view_count"),
-        avg_price=Avg("ads__price"),
-    ).order_by("-total_ads")
+    # Approved ad counts are kept on the category rows; view and price
+    # totals come from the periodically rebuilt summaries once they exist
+    categories = Category.objects.order_by("-active_ads_cache")
+    if CategorySummary.objects.exists():
+        categories = categories.annotate(
+            total_views=F("summary__total_views"),
+            avg_price=Cast("summary__price_total", FloatField())
+            / NullIf("summary__priced_ads", 0),
+        )
+    else:
+        categories = categories.annotate(
+            total_views=Sum("ads__view_count"),
+            avg_price=Avg("ads__price"),
+        )
 
     categories_data = [
         {
-            "id": cat.id,
-            "name": cat.name,
-            "slug": cat.slug,
-            "total_ads": cat.total_ads or 0,
-            "total_views": cat.total_views or 0,
-            "avg_price": float(cat.avg_price) if cat.avg_price else 0,
+            "id": category_id,
+            "name": name,
+            "slug": slug,
+            "total_ads": total_ads,
+            "total_views": total_views or 0,
+            "avg_price": float(avg_price) if avg_price else 0,
         }
-        for cat in categories
+        for category_id, name, slug, total_ads, total_views, avg_price in (
+            categories.values_list(
+                "id", "name", "slug", "active_ads_cache", "total_views", "avg_price"
+            )
+        )
     ]
 
     return Response({"categories": categories_data})
@@ -709,7 +975,7 @@ class AdminBannerViewSet(AdminViewMixin, viewsets.ModelViewSet):
 
     serializer_class = AdminBannerSerializer
     permission_classes = [IsAdminUser]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = StandardResultsSetKeysetPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["is_active", "position", "banner_type"]
     ordering_fields = ["created_at", "title", "impressions", "clicks"]
@@ -717,7 +983,17 @@ class AdminBannerViewSet(AdminViewMixin, viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Get banners queryset."""
-        return Banner.objects.all()
+        if self.action == "analytics":
+            # Only the totals are reported; nothing is serialized
+            return Banner.objects.only("id", "title", "impressions", "clicks")
+        if self.action == "toggle":
+            # Locked so concurrent toggles flip the flag one after another
+            return Banner.objects.select_for_update().only("id", "is_active")
+
+        queryset = AdminBannerSerializer.prefetch_queryset(Banner.objects.all())
+        if self.action == "list":
+            queryset = with_banner_stats(queryset)
+        return queryset
 
     def perform_create(self, serializer):
         """Set created_by when creating banner."""
@@ -726,9 +1002,10 @@ class AdminBannerViewSet(AdminViewMixin, viewsets.ModelViewSet):
     @drf_action(detail=True, methods=["post"])
     def toggle(self, request, pk=None):
         """Toggle banner active status."""
-        banner = self.get_object()
-        banner.is_active = not banner.is_active
-        banner.save()
+        with transaction.atomic():
+            banner = self.get_object()
+            banner.is_active = not banner.is_active
+            banner.save(update_fields=["is_active", "updated_at"])
 
         action = "activated" if banner.is_active else "deactivated"
 
@@ -745,23 +1022,15 @@ class AdminBannerViewSet(AdminViewMixin, viewsets.ModelViewSet):
         end_date = timezone.now()
         start_date = end_date - timedelta(days=30)
 
-        from .models import BannerImpression, BannerClick
-
-        daily_impressions = (
-            BannerImpression.objects.filter(banner=banner, viewed_at__gte=start_date)
-            .annotate(day=TruncDate("viewed_at"))
-            .values("day")
-            .annotate(impressions=Count("id"))
-            .order_by("day")
-        )
-
-        daily_clicks = (
-            BannerClick.objects.filter(banner=banner, clicked_at__gte=start_date)
-            .annotate(day=TruncDate("clicked_at"))
-            .values("day")
-            .annotate(clicks=Count("id"))
-            .order_by("day")
-        )
+        # Daily impressions and clicks, closed days read from the rollup
+        daily = banner_series(banner, start_date)
+        daily_impressions = [
+            {"day": row["date"], "impressions": row["count"]}
+            for row in daily["impressions"]
+        ]
+        daily_clicks = [
+            {"day": row["date"], "clicks": row["count"]} for row in daily["clicks"]
+        ]
 
         return Response(
             {
@@ -772,8 +1041,8 @@ class AdminBannerViewSet(AdminViewMixin, viewsets.ModelViewSet):
                     "total_clicks": banner.clicks,
                     "ctr": banner.ctr,
                 },
-                "daily_impressions": list(daily_impressions),
-                "daily_clicks": list(daily_clicks),
+                "daily_impressions": daily_impressions,
+                "daily_clicks": daily_clicks,
             }
         )
 
@@ -786,8 +1055,6 @@ class AdminBannerViewSet(AdminViewMixin, viewsets.ModelViewSet):
 @permission_classes([IsAdminUser])
 def admin_city_list(request):
     """List all cities (both active and inactive) for admin management."""
-    from content.serializers import CitySerializer
-    from content.models import City
     
     # Get all cities (both active and inactive)
     cities = City.objects.select_related('state').all()
@@ -817,51 +1084,49 @@ class AdminStateListView(generics.ListCreateAPIView):
 
     serializer_class = AdminStateSerializer
     permission_classes = [IsAdminUser]
-    queryset = State.objects.all().order_by("name")
+
+    def get_queryset(self):
+        return with_state_ad_stats(State.objects.all()).order_by("name")
 
     def list(self, request, *args, **kwargs):
         """Custom list response with stats."""
-        queryset = self.get_queryset()
-
-        states_data = []
-        for state in queryset:
-            # Get stats for this state
-            ads_count = Ad.objects.filter(state=state).exclude(status="deleted").count()
-            active_ads = Ad.objects.filter(state=state, status="approved").count()
-            users_count = (
-                Ad.objects.filter(state=state).values("user").distinct().count()
-            )
+        states_data = cache.get_or_set(
+            admin_stats_key("states"), self.get_states_data, ADMIN_CATALOG_TIMEOUT
+        )
 
-            # Build absolute URLs for images
-            logo_url = None
-            if state.logo:
-                logo_url = request.build_absolute_uri(state.logo.url)
-            
-            favicon_url = None
-            if state.favicon:
-                favicon_url = request.build_absolute_uri(state.favicon.url)
+        # Cached rows hold relative media URLs; the host comes from the request
+        def absolute(url):
+            return request.build_absolute_uri(url) if url else None
 
-            states_data.append(
-                {
-                    "id": state.id,
-                    "code": state.code,
-                    "name": state.name,
-                    "domain": state.domain,
-                    "logo": logo_url,
-                    "favicon": favicon_url,
-                    "meta_title": state.meta_title,
-                    "meta_description": state.meta_description,
-                    "is_active": state.is_active,
-                    "total_ads": ads_count,
-                    "active_ads": active_ads,
-                    "users_count": users_count,
-                    "created_at": state.created_at.isoformat(),
-                    "updated_at": state.updated_at.isoformat(),
-                }
-            )
+        states_data = [
+            {**state, "logo": absolute(state["logo"]), "favicon": absolute(state["favicon"])}
+            for state in states_data
+        ]
 
         return Response({"results": states_data})
 
+    def get_states_data(self):
+        """Build the state rows shown in the admin state list."""
+        return [
+            {
+                "id": state.id,
+                "code": state.code,
+                "name": state.name,
+                "domain": state.domain,
+                "logo": state.logo.url if state.logo else None,
+                "favicon": state.favicon.url if state.favicon else None,
+                "meta_title": state.meta_title,
+                "meta_description": state.meta_description,
+                "is_active": state.is_active,
+                "total_ads": state.total_ads_cache,
+                "active_ads": state.active_ads_cache,
+                "users_count": state.users_count,
+                "created_at": state.created_at.isoformat(),
+                "updated_at": state.updated_at.isoformat(),
+            }
+            for state in self.get_queryset()
+        ]
+
     def create(self, request, *args, **kwargs):
         """Create a new state with better error handling."""
         try:
@@ -904,9 +1169,11 @@ class AdminStateDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     serializer_class = AdminStateSerializer
     permission_classes = [IsAdminUser]
-    queryset = State.objects.all()
     lookup_field = 'id'
 
+    def get_queryset(self):
+        return with_state_ad_stats(State.objects.all())
+
     def update(self, request, *args, **kwargs):
         """Update state with better error handling and optional image updates."""
         try:
@@ -978,17 +1245,35 @@ class AdminCategoryStatsView(generics.ListAPIView):
     def get(self, request):
         state_filter = request.query_params.get("state", "all")
 
-        # Base queryset
+        categories_data = cache.get_or_set(
+            admin_stats_key("categories", state_filter),
+            lambda: self.get_categories_data(state_filter),
+            ADMIN_CATALOG_TIMEOUT,
+        )
+        return Response({"categories": categories_data})
+
+    def get_categories_data(self, state_filter):
+        """Build the per-category ad counts for ``state_filter``."""
         categories = Category.objects.filter(is_active=True)
+        if state_filter == "all":
+            # Site-wide counts are kept on the category rows
+            categories = categories.annotate(
+                total_ads=F("total_ads_cache"),
+                active_ads=F("active_ads_cache"),
+                pending_ads=F("pending_ads_cache"),
+            )
+        else:
+            # Count every category's ads in the state in one grouped query
+            ads_filter = ~Q(ads__status="deleted") & Q(ads__state__code=state_filter)
+            categories = categories.annotate(
+                total_ads=Count("ads", filter=ads_filter),
+                active_ads=Count("ads", filter=ads_filter & Q(ads__status="approved")),
+                pending_ads=Count("ads", filter=ads_filter & Q(ads__status="pending")),
+            )
 
         # Prepare stats
         categories_data = []
         for category in categories:
-            ads_qs = category.ads.exclude(status="deleted")
-
-            if state_filter != "all":
-                ads_qs = ads_qs.filter(state__code=state_filter)
-
             categories_data.append(
                 {
                     "id": category.id,
@@ -998,13 +1283,13 @@ class AdminCategoryStatsView(generics.ListAPIView):
                     "description": category.description,
                     "sort_order": category.sort_order,
                     "is_active": category.is_active,
-                    "total_ads": ads_qs.count(),
-                    "active_ads": ads_qs.filter(status="approved").count(),
-                    "pending_ads": ads_qs.filter(status="pending").count(),
+                    "total_ads": category.total_ads,
+                    "active_ads": category.active_ads,
+                    "pending_ads": category.pending_ads,
                 }
             )
 
-        return Response({"categories": categories_data})
+        return categories_data
 
 
 @api_view(["POST"])
@@ -1044,8 +1329,6 @@ def admin_category_detail(request, category_id):
 @permission_classes([IsAdminUser])
 def admin_city_create(request):
     """Create a new city."""
-    from content.serializers import CitySerializer
-
     serializer = CitySerializer(data=request.data, context={'request': request})
     if serializer.is_valid():
         city = serializer.save()
@@ -1057,8 +1340,6 @@ def admin_city_create(request):
 @permission_classes([IsAdminUser])
 def admin_city_detail(request, city_id):
     """Get, update, or delete a city."""
-    from content.serializers import CitySerializer
-
     city = get_object_or_404(City, id=city_id)
 
     if request.method == "GET":
@@ -1086,32 +1367,7 @@ def admin_city_detail(request, city_id):
 @permission_classes([IsAdminUser])
 def admin_settings(request):
     """Get admin settings."""
-    settings, created = AdminSettings.objects.get_or_create(
-        pk=1,
-        defaults={
-            'site_name': 'Classified Ads',
-            'contact_email': '',
-            'support_phone': '',
-            'allow_registration': True,
-            'require_email_verification': True,
-            'auto_approve_ads': False,
-            'featured_ad_price': 9.99,
-            'featured_ad_duration_days': 30,
-        }
-    )
-
-    return Response(
-        {
-            "site_name": settings.site_name,
-            "contact_email": settings.contact_email,
-            "support_phone": settings.support_phone,
-            "allow_registration": settings.allow_registration,
-            "require_email_verification": settings.require_email_verification,
-            "auto_approve_ads": settings.auto_approve_ads,
-            "featured_ad_price": float(settings.featured_ad_price),
-            "featured_ad_duration_days": settings.featured_ad_duration_days,
-        }
-    )
+    return Response(get_admin_settings())
 
 
 @api_view(["PUT"])
@@ -1119,17 +1375,7 @@ def admin_settings(request):
 def admin_settings_update(request):
     """Update admin settings."""
     settings, created = AdminSettings.objects.get_or_create(
-        pk=1,
-        defaults={
-            'site_name': 'Classified Ads',
-            'contact_email': '',
-            'support_phone': '',
-            'allow_registration': True,
-            'require_email_verification': True,
-            'auto_approve_ads': False,
-            'featured_ad_price': 9.99,
-            'featured_ad_duration_days': 30,
-        }
+        pk=1, defaults=ADMIN_SETTINGS_DEFAULTS
     )
 
     # Update fields
@@ -1166,18 +1412,34 @@ def admin_settings_update(request):
 # ============================================================================
 
 
+# Rows fetched per database round trip while streaming an export
+EXPORT_CHUNK_SIZE = 2000
+
+
 @api_view(["GET"])
 @permission_classes([IsAdminUser])
 def admin_export_ads(request):
     """Export ads data to CSV."""
-    import csv
-    from django.http import HttpResponse
-
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="ads_export.csv"'
+    ads = Ad.objects.values_list(
+        "id",
+        "title",
+        "user__email",
+        "category__name",
+        "city__name",
+        "state__name",
+        "price",
+        "status",
+        "plan",
+        "view_count",
+        "created_at",
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    # Columns are exported as selected; only created_at (last) is formatted
+    rows = (
+        [*ad[:-1], ad[-1].strftime("%Y-%m-%d %H:%M:%S")] for ad in ads
+    )
 
-    writer = csv.writer(response)
-    writer.writerow(
+    return streaming_csv_response(
+        "ads_export.csv",
         [
             "ID",
             "Title",
@@ -1190,82 +1452,100 @@ def admin_export_ads(request):
             "Plan",
             "Views",
             "Created At",
-        ]
+        ],
+        rows,
     )
 
-    ads = Ad.objects.select_related("user", "category", "city", "state").all()
-
-    for ad in ads:
-        writer.writerow(
-            [
-                ad.id,
-                ad.title,
-                ad.user.email,
-                ad.category.name,
-                ad.city.name,
-                ad.state.name,
-                ad.price,
-                ad.status,
-                ad.plan,
-                ad.view_count,
-                ad.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-            ]
-        )
-
-    return response
-
 
 @api_view(["GET"])
 @permission_classes([IsAdminUser])
 def admin_export_users(request):
     """Export users data to CSV."""
-    import csv
-    from django.http import HttpResponse
-
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="users_export.csv"'
-
-    writer = csv.writer(response)
-    writer.writerow(
-        ["ID", "Email", "Name", "Phone", "Status", "Total Ads", "Joined Date"]
+    # Counted in the export query rather than per user; "Total Ads" includes
+    # deleted ads, which the denormalized counters leave out
+    users = (
+        User.objects.only(
+            "id",
+            "email",
+            "first_name",
+            "last_name",
+            "phone",
+            "is_active",
+            "is_suspended",
+            "created_at",
+        )
+        .annotate(ads_count=Count("ads"))
+        .order_by("-created_at")
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
     )
 
-    users = User.objects.prefetch_related("ads").all()
-
-    for user in users:
-        status = "Active"
-        if not user.is_active:
-            status = "Banned"
-        elif user.is_suspended:
-            status = "Suspended"
+    def rows():
+        for user in users:
+            status = "Active"
+            if not user.is_active:
+                status = "Banned"
+            elif user.is_suspended:
+                status = "Suspended"
 
-        writer.writerow(
-            [
+            yield [
                 user.id,
                 user.email,
                 user.get_full_name(),
                 user.phone or "",
                 status,
-                user.ads.count(),
+                user.ads_count,
                 user.created_at.strftime("%Y-%m-%d %H:%M:%S"),
             ]
-        )
 
-    return response
+    return streaming_csv_response(
+        "users_export.csv",
+        ["ID", "Email", "Name", "Phone", "Status", "Total Ads", "Joined Date"],
+        rows(),
+    )
 
 
 @api_view(["GET"])
 @permission_classes([IsAdminUser])
 def admin_export_reports(request):
     """Export reports data to CSV."""
-    import csv
-    from django.http import HttpResponse
-
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="reports_export.csv"'
+    reports = AdReport.objects.values_list(
+        "id",
+        "ad_id",
+        "ad__title",
+        "reported_by__email",
+        "reason",
+        "description",
+        "is_reviewed",
+        "reviewed_by__email",
+        "created_at",
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    rows = (
+        [
+            report_id,
+            ad_id,
+            ad_title,
+            reporter_email or "Anonymous",
+            AdReport.REASON_LABELS.get(reason, reason),
+            description,
+            "Reviewed" if is_reviewed else "Pending",
+            reviewer_email or "",
+            created_at.strftime("%Y-%m-%d %H:%M:%S"),
+        ]
+        for (
+            report_id,
+            ad_id,
+            ad_title,
+            reporter_email,
+            reason,
+            description,
+            is_reviewed,
+            reviewer_email,
+            created_at,
+        ) in reports
+    )
 
-    writer = csv.writer(response)
-    writer.writerow(
+    return streaming_csv_response(
+        "reports_export.csv",
         [
             "ID",
             "Ad ID",
@@ -1276,70 +1556,53 @@ def admin_export_reports(request):
             "Status",
             "Reviewed By",
             "Created At",
-        ]
+        ],
+        rows,
     )
 
-    reports = AdReport.objects.select_related("ad", "reported_by", "reviewed_by").all()
-
-    for report in reports:
-        writer.writerow(
-            [
-                report.id,
-                report.ad.id,
-                report.ad.title,
-                report.reported_by.email if report.reported_by else "Anonymous",
-                report.get_reason_display(),
-                report.description,
-                "Reviewed" if report.is_reviewed else "Pending",
-                report.reviewed_by.email if report.reviewed_by else "",
-                report.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-            ]
-        )
-
-    return response
-
 
 @api_view(["GET"])
 @permission_classes([IsAdminUser])
 def admin_export_analytics(request):
     """Export analytics data to CSV."""
-    import csv
-    from django.http import HttpResponse
-
-    days = int(request.GET.get("days", 30))
+    days = analytics_days(request)
     end_date = timezone.now()
     start_date = end_date - timedelta(days=days)
 
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="analytics_export.csv"'
-
-    writer = csv.writer(response)
-    writer.writerow(["Date", "New Ads", "New Users", "Views", "Contacts"])
-
-    # Daily aggregation
-    dates = []
-    current_date = start_date.date()
-    while current_date <= end_date.date():
-        dates.append(current_date)
-        current_date += timedelta(days=1)
-
-    for date in dates:
-        new_ads = Ad.objects.filter(created_at__date=date).count()
-        new_users = User.objects.filter(created_at__date=date).count()
-        views = AdView.objects.filter(viewed_at__date=date).count()
-        contacts = AdContact.objects.filter(contacted_at__date=date).count()
-
-        writer.writerow(
-            [
-                date.strftime("%Y-%m-%d"),
-                new_ads,
-                new_users,
-                views,
-                contacts,
-            ]
-        )
+    # Whole days from the first one on, counted in one grouped query
+    first_day = timezone.localtime(start_date).date()
+    dates = [
+        first_day + timedelta(days=offset)
+        for offset in range((timezone.localtime(end_date).date() - first_day).days + 1)
+    ]
+    since = start_of_day(first_day)
+    daily = daily_counts(
+        ads=(Ad.objects.filter(created_at__gte=since), "created_at"),
+        users=(User.objects.filter(created_at__gte=since), "created_at"),
+        views=(AdView.objects.filter(viewed_at__gte=since), "viewed_at"),
+        contacts=(AdContact.objects.filter(viewed_at__gte=since), "viewed_at"),
+    )
+    counts = {
+        series: {row["date"]: row["count"] for row in rows}
+        for series, rows in daily.items()
+    }
 
-    return response
+    rows = (
+        [
+            date.strftime("%Y-%m-%d"),
+            counts["ads"].get(date, 0),
+            counts["users"].get(date, 0),
+            counts["views"].get(date, 0),
+            counts["contacts"].get(date, 0),
+        ]
+        for date in dates
+    )
+
+    return streaming_csv_response(
+        "analytics_export.csv",
+        ["Date", "New Ads", "New Users", "Views", "Contacts"],
+        rows,
+    )
 
 
 # ============================================================================
@@ -1351,8 +1614,6 @@ def admin_export_analytics(request):
 @permission_classes([IsAdminUser])
 def admin_clear_cache(request):
     """Clear application cache."""
-    from django.core.cache import cache
-
     cache.clear()
     return Response({"message": "Cache cleared successfully"})
 
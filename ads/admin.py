@@ -1,10 +1,13 @@
 # ads/admin.py
 from django.contrib import admin
+from django.db import transaction
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils import timezone
-from django.db.models import Count, Sum
+from django.db.models import Count, F, Sum
 from .models import Ad, AdImage, AdView, AdContact, AdFavorite, AdReport
+from .counters import ad_counter_changes
+from administrator.cache_utils import invalidate_admin_ad_rows, invalidate_admin_stats
 
 class AdImageInline(admin.TabularInline):
     """Inline admin for ad images."""
@@ -122,9 +125,25 @@ class AdAdmin(admin.ModelAdmin):
         return obj.display_price
     price_display.short_description = 'Price'
     
+    def update_selected(self, queryset, **changes):
+        """
+        Apply ``changes`` to the selected ads with one UPDATE, keeping the ad
+        counters and the admin caches in step. Returns the rows updated.
+        """
+        # The changelist filters may stop matching once the ads change, so
+        # everything after the UPDATE goes by the selected ids
+        ad_ids = list(queryset.values_list('pk', flat=True))
+        ads = Ad.objects.filter(pk__in=ad_ids)
+        with transaction.atomic(), ad_counter_changes(ads):
+            updated = ads.update(**changes)
+        invalidate_admin_ad_rows(ad_ids)
+        invalidate_admin_stats()
+        return updated
+    
     def approve_ads(self, request, queryset):
         """Bulk approve ads."""
-        updated = queryset.update(
+        updated = self.update_selected(
+            queryset,
             status='approved',
             approved_by=request.user,
             approved_at=timezone.now(),
@@ -135,7 +154,8 @@ class AdAdmin(admin.ModelAdmin):
     
     def reject_ads(self, request, queryset):
         """Bulk reject ads."""
-        updated = queryset.update(
+        updated = self.update_selected(
+            queryset,
             status='rejected',
             rejection_reason='Bulk rejection by admin'
         )
@@ -144,7 +164,8 @@ class AdAdmin(admin.ModelAdmin):
     
     def make_featured(self, request, queryset):
         """Make ads featured."""
-        updated = queryset.update(
+        updated = self.update_selected(
+            queryset,
             plan='featured',
             featured_expires_at=timezone.now() + timezone.timedelta(days=30)
         )
@@ -153,10 +174,13 @@ class AdAdmin(admin.ModelAdmin):
     
     def extend_expiry(self, request, queryset):
         """Extend ad expiry by 30 days."""
-        for ad in queryset:
-            ad.expires_at += timezone.timedelta(days=30)
-            ad.save()
-        self.message_user(request, f'{queryset.count()} ads extended by 30 days.')
+        # Each ad keeps its own expiry, so the shift is done in the UPDATE
+        updated = self.update_selected(
+            queryset,
+            expires_at=F('expires_at') + timezone.timedelta(days=30),
+            updated_at=timezone.now()
+        )
+        self.message_user(request, f'{updated} ads extended by 30 days.')
     extend_expiry.short_description = 'Extend expiry by 30 days'
 
 @admin.register(AdImage)
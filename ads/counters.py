@@ -0,0 +1,200 @@
+# ads/counters.py
+"""
+Denormalized ad counters stored on the rows ads belong to.
+
+User, State, City and Category carry ``*_ads_cache`` columns so list pages
+can read ad counts without aggregating the ads table. Writes keep them
+current with atomic ``F()`` deltas: ``ads.signals`` moves a saved or
+deleted ad's counts from its old rows to its new ones, and bulk updates
+wrap their UPDATE in ``ad_counter_changes()``. Neither rescans the ads
+table. ``manage.py recount_ads`` recomputes the columns from the ads table
+with ``refresh_ad_counters()`` to reconcile any drift.
+"""
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+# Counter column -> condition on the related ads
+AD_COUNTERS = {
+    "total_ads_cache": ~Q(status="deleted"),
+    "active_ads_cache": Q(status="approved"),
+    "pending_ads_cache": Q(status="pending"),
+}
+
+USER_AD_COUNTERS = {
+    **AD_COUNTERS,
+    "featured_ads_cache": Q(plan="featured"),
+}
+
+# States also carry the remaining admin dashboard figures, so the dashboard
+# can sum state rows instead of scanning the ads table
+STATE_AD_COUNTERS = {
+    **AD_COUNTERS,
+    "rejected_ads_cache": Q(status="rejected"),
+    "live_featured_ads_cache": Q(plan="featured") & ~Q(status="deleted"),
+}
+
+# Ad foreign key -> (model label, counters kept on that model)
+COUNTED_RELATIONS = {
+    "user": (settings.AUTH_USER_MODEL, USER_AD_COUNTERS),
+    "category": ("content.Category", AD_COUNTERS),
+    "city": ("content.City", AD_COUNTERS),
+    "state": ("content.State", STATE_AD_COUNTERS),
+}
+
+
+def refresh_ad_counters(relation, pks=None):
+    """
+    Recompute the counters of the ``relation`` rows with the given pks.
+
+    ``pks=None`` refreshes every row. Each call is a single UPDATE with one
+    correlated subquery per counter column, scanning the related ads; it is
+    meant for reconciliation (``manage.py recount_ads``), not for writes.
+    """
+    label, counters = COUNTED_RELATIONS[relation]
+    model = global_apps.get_model(label)
+    ad_model = global_apps.get_model("ads", "Ad")
+
+    queryset = model._default_manager.all()
+    if pks is not None:
+        pks = {pk for pk in pks if pk is not None}
+        if not pks:
+            return 0
+        queryset = queryset.filter(pk__in=pks)
+
+    return queryset.update(
+        **{
+            column: Coalesce(
+                Subquery(
+                    ad_model._default_manager.filter(
+                        condition, **{relation: OuterRef("pk")}
+                    )
+                    .order_by()
+                    .values(relation)
+                    .annotate(total=Count("*"))
+                    .values("total"),
+                    output_field=IntegerField(),
+                ),
+                0,
+            )
+            for column, condition in counters.items()
+        }
+    )
+
+
+def condition_matches(condition, values):
+    """
+    Whether an ad with the counted ``values`` meets a counter ``condition``.
+
+    Counter conditions are Qs of exact lookups on counted fields, so they
+    can be evaluated in Python without asking the database.
+    """
+    results = [
+        condition_matches(child, values)
+        if isinstance(child, Q)
+        else values[child[0]] == child[1]
+        for child in condition.children
+    ]
+    matched = all(results) if condition.connector == Q.AND else any(results)
+    return matched != condition.negated
+
+
+def add_counter_deltas(deltas, values, amount):
+    """
+    Add ``amount`` to ``deltas`` for every counter an ad with the counted
+    ``values`` contributes to.
+
+    ``deltas`` maps relation -> related pk -> counter column -> change.
+    """
+    for relation, (label, counters) in COUNTED_RELATIONS.items():
+        pk = values.get(f"{relation}_id")
+        if pk is None:
+            continue
+        for column, condition in counters.items():
+            if condition_matches(condition, values):
+                deltas[relation][pk][column] += amount
+
+
+def counter_deltas():
+    """Empty ``deltas`` mapping for add_counter_deltas()."""
+    return defaultdict(lambda: defaultdict(Counter))
+
+
+def apply_counter_deltas(deltas):
+    """
+    Apply ``deltas`` with atomic ``F()`` updates.
+
+    Rows getting the same changes share one UPDATE; rows and columns whose
+    changes cancel out are not written. Counters never go below zero.
+    """
+    for relation, rows in deltas.items():
+        label, _ = COUNTED_RELATIONS[relation]
+        model = global_apps.get_model(label)
+
+        pks_by_change = defaultdict(list)
+        for pk, changes in rows.items():
+            change = tuple(sorted(
+                (column, delta) for column, delta in changes.items() if delta
+            ))
+            if change:
+                pks_by_change[change].append(pk)
+
+        for change, pks in pks_by_change.items():
+            model._default_manager.filter(pk__in=sorted(pks)).update(
+                **{
+                    column: Greatest(F(column) + delta, Value(0))
+                    for column, delta in change
+                }
+            )
+
+
+def update_counters_for_ad(previous, current):
+    """
+    Move one ad's counts from its ``previous`` counted values to its
+    ``current`` ones; either is None when the ad did not or no longer
+    exists.
+    """
+    if previous == current:
+        return
+    deltas = counter_deltas()
+    if previous is not None:
+        add_counter_deltas(deltas, previous, -1)
+    if current is not None:
+        add_counter_deltas(deltas, current, 1)
+    apply_counter_deltas(deltas)
+
+
+@contextmanager
+def ad_counter_changes(*ad_querysets):
+    """
+    Apply the counter changes of the ads in ``ad_querysets`` made inside the
+    block, for writes such as ``queryset.update()`` that skip the signals.
+
+    Must run inside a transaction. The ads are locked while their old values
+    are read, so no concurrent save can change them before the block's
+    UPDATE. The querysets must select the same ads after the block (filter
+    them by id, not by a column the block changes).
+    """
+    ad_model = global_apps.get_model("ads", "Ad")
+    fields = ad_model.COUNTED_FIELDS
+
+    before = Counter()
+    for ads in ad_querysets:
+        before.update(
+            ads.order_by().select_for_update().values_list(*fields).iterator()
+        )
+
+    yield
+
+    deltas = counter_deltas()
+    for values, amount in before.items():
+        add_counter_deltas(deltas, dict(zip(fields, values)), -amount)
+    for ads in ad_querysets:
+        grouped = ads.order_by().values_list(*fields).annotate(amount=Count("pk"))
+        for *values, amount in grouped:
+            add_counter_deltas(deltas, dict(zip(fields, values)), amount)
+    apply_counter_deltas(deltas)
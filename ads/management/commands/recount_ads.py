@@ -0,0 +1,23 @@
+# ads/management/commands/recount_ads.py
+from django.core.management.base import BaseCommand
+
+from ads.counters import COUNTED_RELATIONS, refresh_ad_counters
+
+
+class Command(BaseCommand):
+    help = 'Recompute the denormalized ad counters on users, states, cities and categories'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--relation',
+            choices=list(COUNTED_RELATIONS),
+            action='append',
+            help='Only recount this relation (may be given more than once)',
+        )
+
+    def handle(self, *args, **options):
+        for relation in options['relation'] or COUNTED_RELATIONS:
+            updated = refresh_ad_counters(relation)
+            self.stdout.write(f'Recounted ads for {updated} {relation} rows')
+
+        self.stdout.write(self.style.SUCCESS('Ad counters are up to date'))
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0003_alter_ad_status'),
+        ('content', '0002_city_photo'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ad',
+            index=models.Index(condition=models.Q(('plan', 'featured')), fields=['featured_expires_at'], name='ad_featured_idx'),
+        ),
+    ]
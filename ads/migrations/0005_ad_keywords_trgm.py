@@ -0,0 +1,34 @@
+# Trigram index backing the admin "keywords contains" filter.
+#
+# Django compiles ``icontains`` on PostgreSQL to ``UPPER(col::text) LIKE
+# UPPER(%s)``, so the GIN index is built on that exact expression. pg_trgm is
+# PostgreSQL-only; on other backends this migration is a no-op.
+
+from django.db import migrations
+
+
+def create_keywords_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS ad_keywords_trgm ON ads_ad '
+        'USING gin (UPPER(("keywords")::text) gin_trgm_ops)'
+    )
+
+
+def drop_keywords_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS ad_keywords_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0004_ad_featured_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_keywords_trgm_index, drop_keywords_trgm_index),
+    ]
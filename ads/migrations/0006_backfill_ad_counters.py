@@ -0,0 +1,58 @@
+# Fill the denormalized ad counters added to users, states, cities and
+# categories so they are correct as soon as the columns exist.
+#
+# The counting logic is frozen here rather than imported from ads.counters,
+# so later changes to that module cannot alter what this migration does.
+
+from django.db import migrations
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+AD_COUNTERS = {
+    'total_ads_cache': ~Q(status='deleted'),
+    'active_ads_cache': Q(status='approved'),
+    'pending_ads_cache': Q(status='pending'),
+}
+
+# Ad foreign key -> (app label, model name, counters on that model)
+COUNTED_RELATIONS = {
+    'user': ('accounts', 'User', {**AD_COUNTERS, 'featured_ads_cache': Q(plan='featured')}),
+    'category': ('content', 'Category', AD_COUNTERS),
+    'city': ('content', 'City', AD_COUNTERS),
+    'state': ('content', 'State', AD_COUNTERS),
+}
+
+
+def backfill_ad_counters(apps, schema_editor):
+    Ad = apps.get_model('ads', 'Ad')
+    for relation, (app_label, model_name, counters) in COUNTED_RELATIONS.items():
+        model = apps.get_model(app_label, model_name)
+        model._default_manager.update(
+            **{
+                column: Coalesce(
+                    Subquery(
+                        Ad._default_manager.filter(condition, **{relation: OuterRef('pk')})
+                        .order_by()
+                        .values(relation)
+                        .annotate(total=Count('*'))
+                        .values('total'),
+                        output_field=IntegerField(),
+                    ),
+                    0,
+                )
+                for column, condition in counters.items()
+            }
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0005_ad_keywords_trgm'),
+        ('accounts', '0008_user_active_ads_cache_user_featured_ads_cache_and_more'),
+        ('content', '0003_category_active_ads_cache_category_pending_ads_cache_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_ad_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Fill the rejected and live featured counters added to states.
+#
+# The counting logic is frozen here rather than imported from ads.counters,
+# so later changes to that module cannot alter what this migration does.
+
+from django.db import migrations
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+STATE_COUNTERS = {
+    'rejected_ads_cache': Q(status='rejected'),
+    'live_featured_ads_cache': Q(plan='featured') & ~Q(status='deleted'),
+}
+
+
+def backfill_state_counters(apps, schema_editor):
+    Ad = apps.get_model('ads', 'Ad')
+    State = apps.get_model('content', 'State')
+    State._default_manager.update(
+        **{
+            column: Coalesce(
+                Subquery(
+                    Ad._default_manager.filter(condition, state=OuterRef('pk'))
+                    .order_by()
+                    .values('state')
+                    .annotate(total=Count('*'))
+                    .values('total'),
+                    output_field=IntegerField(),
+                ),
+                0,
+            )
+            for column, condition in STATE_COUNTERS.items()
+        }
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0006_backfill_ad_counters'),
+        ('content', '0004_state_live_featured_ads_cache_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_state_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0008_backfill_state_counters'),
+        ('content', '0004_state_live_featured_ads_cache_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ad',
+            index=models.Index(fields=['plan', '-created_at'], name='ads_ad_plan_afea30_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ad',
+            index=models.Index(fields=['state', 'status', '-created_at'], name='ads_ad_state_i_19dbf2_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0009_ad_plan_created_state_status_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='adreport',
+            index=models.Index(condition=models.Q(('is_reviewed', False)), fields=['ad'], name='adreport_pending_idx'),
+        ),
+    ]
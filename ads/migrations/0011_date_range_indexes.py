@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-16 18:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0010_adreport_pending_idx'),
+        ('content', '0004_state_live_featured_ads_cache_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ad',
+            index=models.Index(fields=['created_at'], name='ads_ad_created_9f5b83_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adcontact',
+            index=models.Index(fields=['viewed_at'], name='ads_adconta_viewed__f35743_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adview',
+            index=models.Index(fields=['viewed_at'], name='ads_adview_viewed__61d181_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-16 18:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0011_date_range_indexes'),
+        ('content', '0004_state_live_featured_ads_cache_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ad',
+            index=models.Index(fields=['state', 'created_at', 'status'], name='ads_ad_state_i_a32a52_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-16 18:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ads', '0012_state_created_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='adcontact',
+            name='ads_adconta_viewed__f35743_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='adview',
+            name='ads_adview_viewed__61d181_idx',
+        ),
+        migrations.AddIndex(
+            model_name='adcontact',
+            index=models.Index(fields=['viewed_at', 'ad'], name='ads_adconta_viewed__3a1a7f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adview',
+            index=models.Index(fields=['viewed_at', 'ad'], name='ads_adview_viewed__7cbff7_idx'),
+        ),
+    ]
@@ -1,5 +1,5 @@
 # ads/models.py
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 from django.contrib.auth import get_user_model
@@ -37,6 +37,13 @@ class AdManager(models.Manager):
         return self.filter(created_at__gte=since)
 
 
+class NonDeletedAdManager(AdManager):
+    """Manager scoped to ads that have not been soft-deleted."""
+
+    def get_queryset(self):
+        return super().get_queryset().exclude(status="deleted")
+
+
 class Ad(models.Model):
     """Enhanced model for classified ads with analytics."""
 
@@ -236,6 +243,7 @@ class Ad(models.Model):
     )
 
     objects = AdManager()
+    non_deleted = NonDeletedAdManager()
 
     class Meta:
         verbose_name = _("Ad")
@@ -247,14 +255,37 @@ class Ad(models.Model):
             models.Index(fields=["city", "status", "-created_at"]),
             models.Index(fields=["user", "-created_at"]),
             models.Index(fields=["plan", "status"]),
+            models.Index(fields=["plan", "-created_at"]),
+            models.Index(fields=["state", "status", "-created_at"]),
+            models.Index(fields=["created_at"]),
+            models.Index(fields=["state", "created_at", "status"]),
             models.Index(fields=["expires_at"]),
             models.Index(fields=["featured_expires_at"]),
+            models.Index(
+                fields=["featured_expires_at"],
+                condition=Q(plan="featured"),
+                name="ad_featured_idx",
+            ),
             models.Index(fields=["slug"]),
         ]
 
+    # Columns that feed the denormalized counters in ads.counters
+    COUNTED_FIELDS = ("status", "plan", "user_id", "category_id", "city_id", "state_id")
+
     def __str__(self):
         return self.title
 
+    def get_counted_values(self):
+        """
+        Current values of the loaded COUNTED_FIELDS; deferred ones are left
+        out rather than loaded.
+        """
+        return {
+            name: self.__dict__[name]
+            for name in self.COUNTED_FIELDS
+            if name in self.__dict__
+        }
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = generate_unique_slug(self, self.title)
@@ -268,7 +299,10 @@ class Ad(models.Model):
         if self.plan == "featured" and not self.featured_expires_at:
             self.featured_expires_at = timezone.now() + timedelta(days=30)
 
-        super().save(*args, **kwargs)
+        # ads.signals locks the stored row before the write and moves its
+        # counts after it; both must happen in one transaction
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
 
     @property
     def is_active(self):
@@ -290,6 +324,10 @@ class Ad(models.Model):
     @property
     def primary_image(self):
         """Get the primary image for this ad."""
+        # Reuse prefetch_related("images") results instead of querying again
+        prefetched = getattr(self, "_prefetched_objects_cache", {}).get("images")
+        if prefetched is not None:
+            return next((image for image in prefetched if image.is_primary), None)
         return self.images.filter(is_primary=True).first()
 
     @property
@@ -484,6 +522,7 @@ class AdView(models.Model):
             models.Index(fields=["ad", "-viewed_at"]),
             models.Index(fields=["user", "-viewed_at"]),
             models.Index(fields=["ip_address", "-viewed_at"]),
+            models.Index(fields=["viewed_at", "ad"]),
         ]
 
 
@@ -520,6 +559,7 @@ class AdContact(models.Model):
         indexes = [
             models.Index(fields=["ad", "-viewed_at"]),
             models.Index(fields=["user", "-viewed_at"]),
+            models.Index(fields=["viewed_at", "ad"]),
         ]
 
 
@@ -559,6 +599,8 @@ class AdReport(models.Model):
         ("wrong_category", _("Wrong Category")),
         ("other", _("Other")),
     ]
+    # Reason -> label, for code that labels many reports at once
+    REASON_LABELS = dict(REASON_CHOICES)
 
     ad = models.ForeignKey(
         Ad, on_delete=models.CASCADE, related_name="reports", verbose_name=_("Ad")
@@ -596,4 +638,11 @@ class AdReport(models.Model):
         indexes = [
             models.Index(fields=["ad", "-created_at"]),
             models.Index(fields=["is_reviewed", "-created_at"]),
+            # Pending reports are a small slice of the table; the dashboard
+            # counts them per ad
+            models.Index(
+                fields=["ad"],
+                condition=Q(is_reviewed=False),
+                name="adreport_pending_idx",
+            ),
         ]
@@ -0,0 +1,59 @@
+# ads/signals.py
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .counters import COUNTED_RELATIONS, update_counters_for_ad
+from .models import Ad
+
+# update_fields entries that can change a counter
+COUNTED_UPDATE_FIELDS = {"status", "plan", *COUNTED_RELATIONS, *Ad.COUNTED_FIELDS}
+
+
+def touches_counters(update_fields):
+    """Whether a save limited to ``update_fields`` can change a counter."""
+    return update_fields is None or bool(COUNTED_UPDATE_FIELDS.intersection(update_fields))
+
+
+@receiver(pre_save, sender=Ad)
+@receiver(pre_delete, sender=Ad)
+def load_stored_counted_values(sender, instance, update_fields=None, **kwargs):
+    """
+    Read and lock the stored counted values of an existing ad.
+
+    The values the instance was loaded with may be stale by now, so the
+    counter deltas are always taken from the locked row. Ad.save() and
+    deletes run inside a transaction, which holds the lock until the
+    counters have been moved.
+    """
+    if instance.pk is None or not touches_counters(update_fields):
+        return
+    instance._counted_values = (
+        Ad.objects.select_for_update()
+        .filter(pk=instance.pk)
+        .values(*Ad.COUNTED_FIELDS)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Ad)
+def update_ad_counters_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """Move the ad's counts from the rows it belonged to onto its current ones."""
+    if not touches_counters(update_fields):
+        return
+
+    previous = None if created else getattr(instance, "_counted_values", None)
+    written = instance.get_counted_values()
+    if update_fields is not None:
+        attnames = {Ad._meta.get_field(name).attname for name in update_fields}
+        written = {name: value for name, value in written.items() if name in attnames}
+    # Fields that were deferred or left out of update_fields were not
+    # written, so they keep their stored value
+    current = {**(previous or {}), **written}
+    update_counters_for_ad(previous, current)
+
+
+@receiver(post_delete, sender=Ad)
+def update_ad_counters_on_delete(sender, instance, **kwargs):
+    """Take a deleted ad's counts off the rows it belonged to."""
+    previous = getattr(instance, "_counted_values", None)
+    update_counters_for_ad(previous, None)
@@ -1,3 +1,218 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.test import TestCase
 
-# Create your tests here.
+from content.models import Category, City, State
+
+from .counters import COUNTED_RELATIONS, ad_counter_changes, refresh_ad_counters
+from .models import Ad
+
+User = get_user_model()
+
+
+class AdCounterTests(TestCase):
+    """The *_ads_cache columns follow ad writes without a recount."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.states = [
+            State.objects.create(
+                name=name, code=code, domain=f"{code.lower()}.example.com",
+                logo="logo.png", meta_title=name, meta_description=name,
+            )
+            for name, code in [("Illinois", "IL"), ("Texas", "TX")]
+        ]
+        cls.cities = [
+            City.objects.create(name=f"City {i}", state=state)
+            for i, state in enumerate(cls.states)
+        ]
+        cls.categories = [
+            Category.objects.create(name=f"Category {i}", icon="icon")
+            for i in range(2)
+        ]
+        cls.users = [
+            User.objects.create_user(
+                email=f"user{i}@example.com", password="pw12345678",
+                first_name="First", last_name="Last",
+            )
+            for i in range(2)
+        ]
+
+    def create_ad(self, index=0, **fields):
+        city = fields.pop("city", self.cities[index])
+        values = {
+            "title": "Ad",
+            "description": "Description " * 5,
+            "user": self.users[index],
+            "category": self.categories[index],
+            "city": city,
+            "state": city.state,
+            "price": 10,
+            **fields,
+        }
+        return Ad.objects.create(**values)
+
+    def stored_counters(self):
+        counters = {}
+        for relation, (label, columns) in COUNTED_RELATIONS.items():
+            model = Ad._meta.get_field(relation).related_model
+            counters[relation] = sorted(
+                model.objects.values_list("pk", *columns)
+            )
+        return counters
+
+    def assertCountersCurrent(self):
+        """Stored counters equal a full recount from the ads table."""
+        stored = self.stored_counters()
+        for relation in COUNTED_RELATIONS:
+            refresh_ad_counters(relation)
+        self.assertEqual(stored, self.stored_counters())
+
+    def test_create(self):
+        self.create_ad(status="approved", plan="featured")
+        self.create_ad(status="pending")
+        self.create_ad(1, status="rejected")
+        self.assertCountersCurrent()
+
+        self.cities[0].refresh_from_db()
+        self.assertEqual(self.cities[0].total_ads_cache, 2)
+        self.assertEqual(self.cities[0].active_ads_cache, 1)
+        self.assertEqual(self.cities[0].pending_ads_cache, 1)
+
+    def test_status_change(self):
+        ad = self.create_ad(status="pending", plan="featured")
+        for status in ["approved", "rejected", "deleted", "approved"]:
+            ad.status = status
+            ad.save()
+            self.assertCountersCurrent()
+
+    def test_save_with_update_fields(self):
+        ad = self.create_ad(status="pending")
+        ad.status = "approved"
+        ad.save(update_fields=["status"])
+        self.assertCountersCurrent()
+
+        # Counted fields left out of update_fields are not written, so
+        # their counts must not move either
+        ad.status = "deleted"
+        ad.title = "Renamed"
+        ad.save(update_fields=["title"])
+        self.assertCountersCurrent()
+
+    def test_foreign_key_move(self):
+        ad = self.create_ad(status="approved", plan="featured")
+        ad.user = self.users[1]
+        ad.category = self.categories[1]
+        ad.city = self.cities[1]
+        ad.state = self.states[1]
+        ad.save()
+        self.assertCountersCurrent()
+
+        self.users[0].refresh_from_db()
+        self.users[1].refresh_from_db()
+        self.assertEqual(self.users[0].featured_ads_cache, 0)
+        self.assertEqual(self.users[1].featured_ads_cache, 1)
+
+    def test_plan_change(self):
+        ad = self.create_ad(status="approved")
+        ad.plan = "featured"
+        ad.save()
+        self.assertCountersCurrent()
+
+        self.states[0].refresh_from_db()
+        self.assertEqual(self.states[0].live_featured_ads_cache, 1)
+
+    def test_save_of_deferred_instance(self):
+        ad = self.create_ad(status="pending")
+        deferred = Ad.objects.only("pk", "title").get(pk=ad.pk)
+        deferred.status = "approved"
+        deferred.save()
+        self.assertCountersCurrent()
+
+    def test_save_of_unloaded_instance(self):
+        ad = self.create_ad(status="pending")
+        unloaded = Ad(pk=ad.pk, **{
+            field.attname: getattr(ad, field.attname)
+            for field in Ad._meta.concrete_fields
+            if not field.primary_key
+        })
+        unloaded.status = "approved"
+        unloaded.save()
+        self.assertCountersCurrent()
+
+    def test_save_of_stale_instance(self):
+        ad = self.create_ad(status="pending")
+        stale = Ad.objects.get(pk=ad.pk)
+        ad.status = "approved"
+        ad.save()
+
+        # The stale copy's status is written over the approval; the counts
+        # move from the stored status, not the one it was loaded with
+        stale.status = "rejected"
+        stale.save(update_fields=["status"])
+        self.assertCountersCurrent()
+
+    def test_save_after_refresh_from_db(self):
+        ad = self.create_ad(status="pending")
+        other = Ad.objects.get(pk=ad.pk)
+        other.status = "approved"
+        other.save()
+
+        ad.refresh_from_db()
+        ad.plan = "featured"
+        ad.save()
+        self.assertCountersCurrent()
+
+    def test_save_with_partial_update_fields(self):
+        ad = self.create_ad(status="pending")
+        ad.status = "approved"
+        ad.plan = "featured"
+        ad.save(update_fields=["status"])
+        self.assertCountersCurrent()
+
+        ad.save(update_fields=["plan"])
+        self.assertCountersCurrent()
+
+    def test_delete(self):
+        kept = self.create_ad(status="approved")
+        ad = self.create_ad(status="approved", plan="featured")
+        ad.delete()
+        self.assertCountersCurrent()
+
+        Ad.objects.filter(pk=kept.pk).delete()
+        self.assertCountersCurrent()
+
+    def test_delete_cascade(self):
+        self.create_ad(status="approved")
+        self.create_ad(1, status="pending", city=self.cities[0])
+        self.categories[0].delete()
+        self.assertCountersCurrent()
+
+    def test_queryset_update(self):
+        ads = [
+            self.create_ad(i % 2, status=status)
+            for i, status in enumerate(["pending", "pending", "approved"])
+        ]
+        selected = Ad.objects.filter(pk__in=[ad.pk for ad in ads])
+        with transaction.atomic(), ad_counter_changes(selected):
+            selected.update(status="rejected", plan="featured")
+        self.assertCountersCurrent()
+
+        self.states[0].refresh_from_db()
+        self.assertEqual(self.states[0].rejected_ads_cache, 2)
+
+    def test_counters_never_go_negative(self):
+        ad = self.create_ad(status="approved")
+        City.objects.filter(pk=ad.city_id).update(active_ads_cache=0)
+        ad.delete()
+
+        self.cities[0].refresh_from_db()
+        self.assertEqual(self.cities[0].active_ads_cache, 0)
+
+    def test_save_does_not_recount(self):
+        ad = self.create_ad(status="pending")
+        ad.status = "approved"
+        # The locked read of the stored values, the ad UPDATE and one
+        # counter UPDATE per related row
+        with self.assertNumQueries(6):
+            ad.save(update_fields=["status"])
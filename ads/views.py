@@ -492,7 +492,7 @@ class DashboardAnalyticsView(generics.GenericAPIView):
         user = request.user
         
         # Basic stats
-        total_ads = user.ads.exclude(status='deleted').count()
+        total_ads = user.ads(manager='non_deleted').count()
         active_ads = user.ads.filter(status='approved').count()
         pending_ads = user.ads.filter(status='pending').count()
         featured_ads = user.ads.filter(plan='featured').count()
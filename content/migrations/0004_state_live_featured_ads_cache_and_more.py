@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0003_category_active_ads_cache_category_pending_ads_cache_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='state',
+            name='live_featured_ads_cache',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='state',
+            name='rejected_ads_cache',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -57,6 +57,13 @@ class State(models.Model):
         help_text=_('Whether this state is active and accepting ads')
     )
     
+    # Denormalized ad counters, maintained by ads.signals
+    total_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    active_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    pending_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    rejected_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    live_featured_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -128,6 +135,11 @@ class City(models.Model):
         help_text=_('Whether this city accepts ads')
     )
     
+    # Denormalized ad counters, maintained by ads.signals
+    total_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    active_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    pending_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -185,6 +197,11 @@ class Category(models.Model):
         help_text=_('Whether this category accepts new ads')
     )
     
+    # Denormalized ad counters, maintained by ads.signals
+    total_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    active_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    pending_ads_cache = models.PositiveIntegerField(default=0, editable=False)
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
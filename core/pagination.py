@@ -1,4 +1,4 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -12,6 +12,62 @@ class LargeResultsSetPagination(PageNumberPagination):
     max_page_size = 200
 
 
+class StandardResultsSetCursorPagination(CursorPagination):
+    """Keyset pagination with the page sizes of StandardResultsSetPagination."""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-created_at'
+
+
+class LargeResultsSetCursorPagination(CursorPagination):
+    """Keyset pagination with the page sizes of LargeResultsSetPagination."""
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = '-created_at'
+
+
+class KeysetPaginationMixin:
+    """
+    Page-number pagination that switches to keyset pagination on request.
+
+    Sending ``?cursor=`` (empty for the first page) returns opaque
+    next/previous links that seek on the ordering columns, so deep pages
+    cost the same as the first one and no COUNT(*) is run. Without the
+    parameter responses keep the usual page-number format.
+    """
+    cursor_query_param = 'cursor'
+    cursor_pagination_class = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.cursor_query_param in request.query_params:
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_paginator:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
+
+
+class StandardResultsSetKeysetPagination(KeysetPaginationMixin, StandardResultsSetPagination):
+    """StandardResultsSetPagination with opt-in keyset pages."""
+    cursor_pagination_class = StandardResultsSetCursorPagination
+
+
+class LargeResultsSetKeysetPagination(KeysetPaginationMixin, LargeResultsSetPagination):
+    """LargeResultsSetPagination with opt-in keyset pages."""
+    cursor_pagination_class = LargeResultsSetCursorPagination
+
+
 class SearchResultsPagination(PageNumberPagination):
     """Pagination for search results."""
     page_size = 20
@@ -1,9 +1,20 @@
+import csv
 import os
 import uuid
+from itertools import islice
+from django.db import connections
+from django.http import StreamingHttpResponse
+from django.db.models import Value
 from django.utils.text import slugify
 from django.utils import timezone
 import re
 
+def chunked(iterable, size):
+    """Yield lists of at most ``size`` consecutive items of ``iterable``."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 def generate_unique_filename(instance, filename):
     """Generate unique filename for uploads."""
     ext = filename.split('.')[-1]
@@ -221,4 +232,65 @@ def calculate_ad_score(ad):
     if ad.plan == 'featured' and ad.is_featured_active:
         score += 25
     
-    return min(score, 100)  # Cap at 100
\ No newline at end of file
+    return min(score, 100)  # Cap at 100
+
+
+def aggregate_many(**aggregations):
+    """
+    Run several independent ``aggregate()`` calls in one database round trip.
+
+    Each keyword maps a result name to ``(queryset, {alias: aggregate})``.
+    Every pair becomes a single-row derived table and the tables are cross
+    joined, so the result is one row holding all figures. Returns
+    ``{name: {alias: value}}``. Values come straight from the cursor, so this
+    is meant for counts rather than aggregates needing field converters.
+    """
+    parts, params, layout, using = [], [], [], None
+    for name, (queryset, aggregates) in aggregations.items():
+        # Grouping by a constant keeps exactly one row, even for empty sets
+        queryset = (
+            queryset.order_by()
+            .annotate(_all=Value(1))
+            .values("_all")
+            .annotate(**aggregates)
+            .values(*aggregates)
+        )
+        using = using or queryset.db
+        sql, query_params = queryset.query.sql_with_params()
+        quoted_name = connections[using].ops.quote_name(name)
+        parts.append(f"({sql}) AS {quoted_name}")
+        params.extend(query_params)
+        layout.append((name, list(aggregates)))
+
+    with connections[using].cursor() as cursor:
+        cursor.execute("SELECT * FROM " + " CROSS JOIN ".join(parts), params)
+        row = iter(cursor.fetchone())
+
+    return {name: {alias: next(row) for alias in aliases} for name, aliases in layout}
+
+
+class _Echo:
+    """File-like object whose write() hands the written line back."""
+
+    def write(self, value):
+        return value
+
+
+def streaming_csv_response(filename, header, rows):
+    """
+    Stream ``rows`` as a CSV attachment named ``filename``.
+
+    Lines are produced as the client reads them, so pairing this with a
+    lazily evaluated ``rows`` (e.g. ``QuerySet.iterator()``) keeps memory
+    flat however many rows are exported.
+    """
+    writer = csv.writer(_Echo())
+
+    def lines():
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
+
+    response = StreamingHttpResponse(lines(), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response